@@ -91,6 +91,8 @@ CREATE TABLE documents (
 CREATE INDEX idx_documents_request_id ON documents(request_id);
 -- lets the database quickly find documents by their file hash. Helps with duplicate uploads
 CREATE INDEX idx_documents_sha256 ON documents(sha256);
+-- serves the per-request document listing, which is always ordered by upload time
+CREATE INDEX idx_documents_request_created ON documents(request_id, created_at);
 
 
 -- tracks each attempt to run Cecilys extraction pipeline
@@ -114,6 +116,8 @@ CREATE TABLE extraction_runs (
 CREATE INDEX idx_extraction_runs_request_id ON extraction_runs(request_id);
 -- find extraction runs by their current state
 CREATE INDEX idx_extraction_runs_status ON extraction_runs(status);
+-- turns "latest extraction run for a request" into a single index lookup instead of a filter + sort
+CREATE INDEX idx_extraction_runs_request_created ON extraction_runs(request_id, created_at DESC);
 
 
 -- citation_chunks stores the exact pieces of text that support extracted facts
@@ -172,6 +176,23 @@ CREATE INDEX idx_evidence_request_id ON grounded_evidence(request_id);
 CREATE INDEX idx_evidence_run_id ON grounded_evidence(extraction_run_id);
 -- lets the database quickly filter evidence by type
 CREATE INDEX idx_evidence_fact_type ON grounded_evidence(fact_type);
+-- evidence is always read per extraction run in insertion order, so the run + time index avoids a sort
+CREATE INDEX idx_evidence_run_created ON grounded_evidence(extraction_run_id, created_at);
+-- lets the database quickly find evidence by key (e.g. fact_key = 'course_code')
+CREATE INDEX idx_evidence_fact_key ON grounded_evidence(fact_key);
+
+-- fact_key is stored trimmed and lower-cased no matter which writer
+-- inserted it (backend, extraction pipeline, seeds), so readers can compare it directly
+CREATE FUNCTION normalize_evidence_keys() RETURNS trigger AS $$
+BEGIN
+  NEW.fact_key := lower(btrim(NEW.fact_key));
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_evidence_normalize_keys
+  BEFORE INSERT OR UPDATE OF fact_key ON grounded_evidence
+  FOR EACH ROW EXECUTE FUNCTION normalize_evidence_keys();
 
 
 -- evidence_citations connects extracted facts to the exact text that supports them.
@@ -208,13 +229,19 @@ CREATE TABLE decision_runs (
   error_message      TEXT,
 
   -- store the input packet used (optional)
-  decision_inputs    JSONB
+  decision_inputs    JSONB,
+  -- copy of decision_inputs->>'inputs_hash' so dedup checks never parse the JSON
+  inputs_hash        TEXT GENERATED ALWAYS AS (decision_inputs->>'inputs_hash') STORED
 );
 
 -- allows the database to quickly find all decision runs for a given request
 CREATE INDEX idx_decision_runs_request_id ON decision_runs(request_id);
 -- allows the database to quickly find decision runs by their current state
 CREATE INDEX idx_decision_runs_status ON decision_runs(status);
+-- turns "latest decision run for a request" into a single index lookup instead of a filter + sort
+CREATE INDEX idx_decision_runs_request_created ON decision_runs(request_id, created_at DESC);
+-- lets the backend check "was this exact packet already decided" with one index probe
+CREATE INDEX idx_decision_runs_request_hash ON decision_runs(request_id, inputs_hash) WHERE status = 'completed';
 
 
 -- storing the decision engine's output
@@ -254,6 +281,8 @@ CREATE TABLE review_actions (
 CREATE INDEX idx_review_actions_request_id ON review_actions(request_id);
 -- find review actions by type
 CREATE INDEX idx_review_actions_action ON review_actions(action);
+-- serves the "latest review for a request" lookup and the ordered audit log
+CREATE INDEX idx_review_actions_request_created ON review_actions(request_id, created_at DESC);
 
 -- reviewers table — also serves as the user table for reviewers, committee members, and admins.
 -- Students do NOT have accounts; they submit cases with student_id/student_name only.
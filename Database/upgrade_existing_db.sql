@@ -0,0 +1,38 @@
+-- Brings a database created from an older db_schema.sql (or restored from a
+-- dump) up to the current schema. Safe to run more than once.
+--   psql -U <your_postgres_username> -d ai_db -f upgrade_existing_db.sql
+
+-- (request, created_at) indexes behind the per-case "latest"/"in order" reads
+CREATE INDEX IF NOT EXISTS idx_documents_request_created ON documents(request_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_extraction_runs_request_created ON extraction_runs(request_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_evidence_run_created ON grounded_evidence(extraction_run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_decision_runs_request_created ON decision_runs(request_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_review_actions_request_created ON review_actions(request_id, created_at DESC);
+
+-- decision_runs.inputs_hash: generated copy of decision_inputs->>'inputs_hash',
+-- mapped by the backend's DecisionRun model
+ALTER TABLE decision_runs
+  ADD COLUMN IF NOT EXISTS inputs_hash TEXT GENERATED ALWAYS AS (decision_inputs->>'inputs_hash') STORED;
+
+CREATE INDEX IF NOT EXISTS idx_decision_runs_request_hash
+  ON decision_runs(request_id, inputs_hash) WHERE status = 'completed';
+
+-- grounded_evidence keys: index, normalize-on-write trigger, and a backfill of
+-- rows written before the trigger existed
+CREATE INDEX IF NOT EXISTS idx_evidence_fact_key ON grounded_evidence(fact_key);
+
+CREATE OR REPLACE FUNCTION normalize_evidence_keys() RETURNS trigger AS $$
+BEGIN
+  NEW.fact_key := lower(btrim(NEW.fact_key));
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_evidence_normalize_keys ON grounded_evidence;
+CREATE TRIGGER trg_evidence_normalize_keys
+  BEFORE INSERT OR UPDATE OF fact_key ON grounded_evidence
+  FOR EACH ROW EXECUTE FUNCTION normalize_evidence_keys();
+
+UPDATE grounded_evidence
+SET fact_key = lower(btrim(fact_key))
+WHERE fact_key IS DISTINCT FROM lower(btrim(fact_key));
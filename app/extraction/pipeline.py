@@ -215,7 +215,7 @@ def _get_active_documents_for_request(conn, request_id: str) -> List[Dict[str, s
             SELECT doc_id, filename, storage_uri
             FROM documents
             WHERE request_id = :request_id AND is_active = TRUE
-            ORDER BY created_at ASC
+            ORDER BY created_at ASC, doc_id ASC
             """
         ),
         {"request_id": request_id},
@@ -9,6 +9,11 @@ from typing import Any, Dict, List, Optional
 import json
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional; only used for the default response class
+    orjson = None
+
 from fastapi import (
     FastAPI,
     Depends,
@@ -19,8 +24,11 @@ from fastapi import (
     BackgroundTasks,
     Query,
 )
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy import DateTime, Integer, Text, cast, create_engine, insert, literal, null, select, text, union_all, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.orm import load_only, sessionmaker, Session
 
 from app.workflow_logger import log_event
 from app.extraction.pipeline import run_extraction as run_extraction_pipeline
@@ -45,8 +53,7 @@ from app.schemas import (
     CaseDetailOut,
     ReviewIn,
     ExtractionCompleteIn,
-    ExtractionStartOut,
-    ExtractionStartDocOut,
+    ExtractionFactIn,
     DecisionResultIn,
     ReviewerCreateIn,
     ReviewerOut,
@@ -61,7 +68,6 @@ from app.schemas import (
     PolicyOut,
     PolicyUpdateIn,
 )
-import httpx
 from decision_engine.contracts import (
     DecisionInputsPacket,
     CourseEvidence,
@@ -85,12 +91,19 @@ engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
 )
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+# Handlers build their responses from objects they have just written, so keep
+# them loaded after commit instead of re-SELECTing every row on first access.
+# Code that needs to see writes from another session calls db.expire_all().
+SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
 
 UPLOAD_DIR = os.getenv("UPLOAD_DIR", "./uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-app = FastAPI(title="Course Equivalency Backend")
+# orjson is an optional speedup; fall back to the stdlib-backed JSONResponse without it
+app = FastAPI(
+    title="Course Equivalency Backend",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
 
 # Retention Check
 from app.security.retention import run_retention_sweep
@@ -123,6 +136,23 @@ DB_TO_FE_STATUS = {
 }
 
 
+# reviewer actions: frontend -> DB and DB -> frontend
+FE_TO_DB_ACTION = {
+    "APPROVE": "approve",
+    "DENY": "deny",
+    "REQUEST_INFO": "request_info",
+    "NEEDS_MORE_INFO": "request_info",
+    "APPROVE_WITH_BRIDGE": "approve_with_bridge",
+}
+
+DB_TO_FE_ACTION = {
+    "approve": "APPROVE",
+    "deny": "DENY",
+    "request_info": "NEEDS_MORE_INFO",
+    "approve_with_bridge": "APPROVE_WITH_BRIDGE",
+}
+
+
 def to_frontend_status(db_status: str) -> str:
     return DB_TO_FE_STATUS.get(db_status, db_status)
 
@@ -195,6 +225,35 @@ def case_to_out(r: Request, db: Session = None) -> CaseOut:
     )
 
 
+def insert_uploaded_documents(
+    db: Session,
+    request_id: uuid.UUID,
+    files: List[UploadFile],
+    now: datetime,
+) -> None:
+    """
+    Save each upload to disk, then insert all their Document rows in one statement.
+    created_at steps by 1us per file so documents list back in upload order.
+    """
+    if not files:
+        return
+    rows = []
+    for i, f in enumerate(files):
+        meta = save_upload(f)
+        rows.append({
+            "request_id": request_id,
+            "filename": meta["filename"],
+            "content_type": meta["content_type"],
+            "sha256": meta["sha256"],
+            "storage_uri": meta["storage_uri"],
+            "size_bytes": meta["size_bytes"],
+            "is_active": True,
+            "created_at": now + timedelta(microseconds=i),
+            "expires_at": now + timedelta(days=90),
+        })
+    db.execute(insert(Document), rows)
+
+
 def doc_to_out(d: Document) -> DocumentOut:
     return DocumentOut(
         docId=str(d.doc_id),
@@ -223,11 +282,21 @@ def build_decision_packet(db: Session, request_id: str) -> Dict[str, Any]:
 
     evidence_rows = (
         db.query(GroundedEvidence)
+        .options(
+            load_only(
+                GroundedEvidence.evidence_id,
+                GroundedEvidence.fact_type,
+                GroundedEvidence.fact_key,
+                GroundedEvidence.fact_value,
+                GroundedEvidence.fact_json,
+                GroundedEvidence.unknown,
+            )
+        )
         .filter(
             GroundedEvidence.request_id == request_id,
             GroundedEvidence.extraction_run_id == latest_run.extraction_run_id,
         )
-        .order_by(GroundedEvidence.created_at.asc())
+        .order_by(GroundedEvidence.created_at.asc(), GroundedEvidence.evidence_id.asc())
         .all()
     )
 
@@ -250,89 +319,161 @@ def build_decision_packet(db: Session, request_id: str) -> Dict[str, Any]:
 
 
 def build_audit_log(db: Session, request_id: str) -> Dict[str, Any]:
-    extraction_runs = (
-        db.query(ExtractionRun)
-        .filter(ExtractionRun.request_id == request_id)
-        .order_by(ExtractionRun.created_at.asc())
-        .all()
-    )
-
-    decision_runs = (
-        db.query(DecisionRun)
-        .filter(DecisionRun.request_id == request_id)
-        .order_by(DecisionRun.created_at.asc())
-        .all()
-    )
-
-    review_actions = (
-        db.query(ReviewAction)
-        .filter(ReviewAction.request_id == request_id)
-        .order_by(ReviewAction.created_at.asc())
-        .all()
+    # All four audit sources are projected onto one column layout and tagged
+    # with a "kind" discriminator so the whole log comes back in a single
+    # UNION ALL round trip; rows are bucketed by kind below.
+    uuid_null = cast(null(), PG_UUID(as_uuid=True))
+    text_null = cast(null(), Text)
+    ts_null = cast(null(), DateTime(timezone=True))
+    int_null = cast(null(), Integer)
+
+    extraction_sel = select(
+        literal("extraction").label("kind"),
+        ExtractionRun.extraction_run_id.label("row_id"),
+        ExtractionRun.status.label("status"),
+        ExtractionRun.created_at.label("created_at"),
+        ExtractionRun.started_at.label("started_at"),
+        ExtractionRun.finished_at.label("finished_at"),
+        ExtractionRun.error_message.label("error_message"),
+        text_null.label("decision"),
+        text_null.label("comment"),
+        uuid_null.label("reviewer_id"),
+        int_null.label("review_cycle"),
+    ).where(ExtractionRun.request_id == request_id)
+
+    decision_sel = (
+        select(
+            literal("decision"),
+            DecisionRun.decision_run_id,
+            DecisionRun.status,
+            DecisionRun.created_at,
+            DecisionRun.started_at,
+            DecisionRun.finished_at,
+            DecisionRun.error_message,
+            DecisionResult.result_json["decision"].astext,
+            text_null,
+            uuid_null,
+            int_null,
+        )
+        .outerjoin(DecisionResult, DecisionResult.decision_run_id == DecisionRun.decision_run_id)
+        .where(DecisionRun.request_id == request_id)
     )
 
-    committee_votes = (
-        db.query(CommitteeVote)
-        .filter(CommitteeVote.request_id == request_id)
-        .order_by(CommitteeVote.created_at.asc())
-        .all()
-    )
+    review_sel = select(
+        literal("review"),
+        ReviewAction.review_action_id,
+        ReviewAction.action,
+        ReviewAction.created_at,
+        ts_null,
+        ts_null,
+        text_null,
+        text_null,
+        ReviewAction.comment,
+        ReviewAction.reviewer_id,
+        int_null,
+    ).where(ReviewAction.request_id == request_id)
+
+    vote_sel = select(
+        literal("vote"),
+        CommitteeVote.vote_id,
+        CommitteeVote.action,
+        CommitteeVote.created_at,
+        ts_null,
+        ts_null,
+        text_null,
+        text_null,
+        CommitteeVote.comment,
+        uuid_null,
+        CommitteeVote.review_cycle,
+    ).where(CommitteeVote.request_id == request_id)
+
+    audit = union_all(extraction_sel, decision_sel, review_sel, vote_sel).subquery()
+    rows = db.execute(select(audit).order_by(audit.c.created_at.asc())).all()
+
+    by_kind: Dict[str, list] = {"extraction": [], "decision": [], "review": [], "vote": []}
+    for row in rows:
+        by_kind[row.kind].append(row)
 
     return {
         "extractionRuns": [
             {
-                "extractionRunId": str(r.extraction_run_id),
+                "extractionRunId": str(r.row_id),
                 "status": r.status,
                 "createdAt": r.created_at,
                 "startedAt": r.started_at,
                 "finishedAt": r.finished_at,
                 "errorMessage": r.error_message,
             }
-            for r in extraction_runs
+            for r in by_kind["extraction"]
         ],
         "decisionRuns": [
             {
-                "decisionRunId": str(r.decision_run_id),
+                "decisionRunId": str(r.row_id),
                 "status": r.status,
                 "createdAt": r.created_at,
                 "startedAt": r.started_at,
                 "finishedAt": r.finished_at,
                 "errorMessage": r.error_message,
-                "decision": (
-                    lambda res: res.result_json.get("decision") if res else None
-                )(db.query(DecisionResult).filter(DecisionResult.decision_run_id == r.decision_run_id).first()),
+                "decision": r.decision,
             }
-            for r in decision_runs
+            for r in by_kind["decision"]
         ],
         "reviewActions": [
             {
-                "reviewActionId": str(a.review_action_id),
-                "action": a.action,
+                "reviewActionId": str(a.row_id),
+                "action": a.status,
                 "comment": a.comment,
                 "reviewerId": a.reviewer_id,
                 "createdAt": a.created_at,
             }
-            for a in review_actions
+            for a in by_kind["review"]
         ],
         "committeeVotes": [
             {
-                "action": v.action,
+                "action": v.status,
                 "comment": v.comment,
                 "createdAt": v.created_at,
                 "reviewCycle": v.review_cycle,
             }
-            for v in committee_votes
+            for v in by_kind["vote"]
         ],
     }
 
+def find_completed_decision_run(
+    db: Session,
+    case_uuid: uuid.UUID,
+    packet_hash: str,
+    extraction_run_id: uuid.UUID,
+) -> Optional[uuid.UUID]:
+    """
+    Returns the id of a completed decision_run for this case that was built from
+    the same inputs and extraction run, or None. The hash is compared on the
+    indexed, generated inputs_hash column; the extraction run id is still read
+    out of the decision_inputs JSONB for the (few) rows that match it.
+    """
+    return db.execute(
+        select(DecisionRun.decision_run_id)
+        .where(
+            DecisionRun.request_id == case_uuid,
+            DecisionRun.status == "completed",
+            DecisionRun.inputs_hash == packet_hash,
+            DecisionRun.decision_inputs["extraction_run_id"].astext == str(extraction_run_id),
+        )
+        .limit(1)
+    ).scalar()
+
+
 def run_decision_for_case_and_run(
     db: Session,
     case_uuid: uuid.UUID,
     extraction_run_id: uuid.UUID,
+    allow_empty_evidence: bool = False,
 ) -> uuid.UUID:
     """
     Creates a decision_run + decision_result for a case, using evidence produced
     by the given extraction_run_id. Updates requests.status accordingly.
+    With allow_empty_evidence, a run without evidence is decided as NEEDS_MORE_INFO
+    (every field unknown) instead of being rejected with 409.
 
     Returns: decision_run_id
     """
@@ -346,16 +487,27 @@ def run_decision_for_case_and_run(
             detail=f"Case not ready_for_decision after extraction (status={case.status})",
         )
 
+    # only the columns the packet mapper, citation lookup and LLM prompt read
     evidence_rows = (
         db.query(GroundedEvidence)
+        .options(
+            load_only(
+                GroundedEvidence.evidence_id,
+                GroundedEvidence.fact_type,
+                GroundedEvidence.fact_key,
+                GroundedEvidence.fact_value,
+                GroundedEvidence.fact_json,
+                GroundedEvidence.unknown,
+            )
+        )
         .filter(
             GroundedEvidence.request_id == case_uuid,
             GroundedEvidence.extraction_run_id == extraction_run_id,
         )
-        .order_by(GroundedEvidence.created_at.asc())
+        .order_by(GroundedEvidence.created_at.asc(), GroundedEvidence.evidence_id.asc())
         .all()
     )
-    if not evidence_rows:
+    if not evidence_rows and not allow_empty_evidence:
         raise HTTPException(status_code=409, detail="No grounded evidence found for extraction_run_id")
 
     decision_run = DecisionRun(
@@ -373,22 +525,11 @@ def run_decision_for_case_and_run(
         packet = build_contracts_packet(case, evidence_rows)
         packet_hash = compute_packet_hash(packet)
 
-        existing_completed = (
-            db.query(DecisionRun)
-            .filter(
-                DecisionRun.request_id == case_uuid,
-                DecisionRun.status == "completed",
-            )
-            .order_by(DecisionRun.created_at.desc())
-            .first()
-        )
-        if existing_completed and isinstance(existing_completed.decision_inputs, dict):
-            prev_hash = existing_completed.decision_inputs.get("inputs_hash")
-            prev_extraction = existing_completed.decision_inputs.get("extraction_run_id")
-            if prev_hash == packet_hash and prev_extraction == str(extraction_run_id):
-                decision_run.status = "completed"
-                decision_run.finished_at = now_utc()
-                return existing_completed.decision_run_id
+        existing_run_id = find_completed_decision_run(db, case_uuid, packet_hash, extraction_run_id)
+        if existing_run_id:
+            decision_run.status = "completed"
+            decision_run.finished_at = now_utc()
+            return existing_run_id
 
         decision_run.decision_inputs = packet.model_dump()
         decision_run.decision_inputs["inputs_hash"] = packet_hash
@@ -536,35 +677,32 @@ def run_extraction_and_decision(caseId: str):
     finally:
         db.close()
 
-# FRONTEND ROUTES
-@app.post("/api/cases", response_model=CaseOut)
-def create_case(
-    studentId: str = Form(...),
-    studentName: Optional[str] = Form(None),
-    courseRequested: Optional[str] = Form(None),
-    files: List[UploadFile] = File(...),
-    background_tasks: BackgroundTasks = None,
-    db: Session = Depends(get_db),
-):
+def create_case_record(
+    db: Session,
+    student_id: str,
+    student_name: Optional[str],
+    course_requested: Optional[str],
+    files: List[UploadFile],
+    now: datetime,
+) -> tuple[Request, ExtractionRun]:
+    """Creates the request, its documents and a queued extraction run; returns (request, run)."""
     req = Request(
-        student_id=studentId,
-        student_name=studentName,
-        course_requested=courseRequested,
+        student_id=student_id,
+        student_name=student_name,
+        course_requested=course_requested,
         status="uploaded",
-        created_at=now_utc(),
-        updated_at=now_utc(),
+        created_at=now,
+        updated_at=now,
     )
     db.add(req)
     db.commit()
-    db.refresh(req)
 
     assigned = db.query(Reviewer).order_by(text("RANDOM()")).first()
     if assigned:
         req.assigned_reviewer_id = assigned.reviewer_id
-        req.updated_at = now_utc()
+        req.updated_at = now
         db.add(req)
         db.commit()
-        db.refresh(req)
 
 
     try:
@@ -580,36 +718,21 @@ def create_case(
                 "doc_count": len(files),
                 "filenames": [f.filename for f in files],
                 "assigned_reviewer_id": str(req.assigned_reviewer_id) if req.assigned_reviewer_id else None,
-                "doc_expires_at": (now_utc() + timedelta(days=90)).isoformat(),
+                "doc_expires_at": (now + timedelta(days=90)).isoformat(),
                 "doc_retention_days": 90,
             },
         )
     except Exception:
         pass
 
-    for f in files:
-        meta = save_upload(f)
-        db.add(
-            Document(
-                request_id=req.request_id,
-                filename=meta["filename"],
-                content_type=meta["content_type"],
-                sha256=meta["sha256"],
-                storage_uri=meta["storage_uri"],
-                size_bytes=meta["size_bytes"],
-                is_active=True,
-                created_at=now_utc(),
-                expires_at=now_utc() + timedelta(days=90),
-            )
-        )
+    insert_uploaded_documents(db, req.request_id, files, now)
 
-    db.add(
-        ExtractionRun(
-            request_id=req.request_id,
-            status="queued",
-            created_at=now_utc(),
-        )
+    run = ExtractionRun(
+        request_id=req.request_id,
+        status="queued",
+        created_at=now,
     )
+    db.add(run)
 
     try:
         log_event(
@@ -623,19 +746,56 @@ def create_case(
         pass
 
     db.commit()
-    db.refresh(req)
+    return req, run
+
+
+# FRONTEND ROUTES
+@app.post("/api/cases", response_model=CaseOut)
+def create_case(
+    studentId: str = Form(...),
+    studentName: Optional[str] = Form(None),
+    courseRequested: Optional[str] = Form(None),
+    files: List[UploadFile] = File(...),
+    background_tasks: BackgroundTasks = None,
+    db: Session = Depends(get_db),
+):
+    req, _ = create_case_record(db, studentId, studentName, courseRequested, files, now_utc())
     background_tasks.add_task(run_extraction_and_decision, str(req.request_id))
     return case_to_out(req, db)
 
 
-@app.get("/api/cases/{caseId}", response_model=CaseDetailOut)
-def get_case(caseId: str, db: Session = Depends(get_db)):
+@app.post("/api/cases/pipeline")
+def run_case_pipeline(
+    studentId: str = Form(...),
+    studentName: Optional[str] = Form(None),
+    courseRequested: Optional[str] = Form(None),
+    facts: str = Form(...),
+    files: List[UploadFile] = File(...),
+    db: Session = Depends(get_db),
+):
+    """
+    Create + extraction/complete + decision result in one round trip, for clients
+    that already have the extracted facts (a JSON list in the `facts` form field).
+    The PDF extraction pipeline is not run.
+    """
     try:
-        case_uuid = uuid.UUID(caseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid caseId (must be a UUID)")
+        fact_list = [ExtractionFactIn.model_validate(f) for f in json.loads(facts)]
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid facts: {e}")
+
+    req, run = create_case_record(db, studentId, studentName, courseRequested, files, now_utc())
+
+    out = {"caseId": str(req.request_id), **complete_extraction_run(db, req.request_id, run.extraction_run_id, fact_list)}
+    if "decisionRunId" in out:
+        res = db.get(DecisionResult, uuid.UUID(out["decisionRunId"]))
+        out["resultJson"] = res.result_json if res else None
+        out["needsMoreInfo"] = bool(res.needs_more_info) if res else None
+    return out
 
-    req = db.query(Request).filter(Request.request_id == case_uuid).first()
+
+@app.get("/api/cases/{caseId}", response_model=CaseDetailOut)
+def get_case(caseId: uuid.UUID, db: Session = Depends(get_db)):
+    req = db.query(Request).filter(Request.request_id == caseId).first()
     if not req:
         raise HTTPException(status_code=404, detail="Case not found")
 
@@ -655,16 +815,16 @@ def get_case(caseId: str, db: Session = Depends(get_db)):
 
     docs = (
         db.query(Document)
-        .filter(Document.request_id == case_uuid)
-        .order_by(Document.created_at.asc())
+        .filter(Document.request_id == caseId)
+        .order_by(Document.created_at.asc(), Document.doc_id.asc())
         .all()
     )
 
-    evidence_packet = build_decision_packet(db, case_uuid)
+    evidence_packet = build_decision_packet(db, caseId)
 
     latest_decision_run = (
         db.query(DecisionRun)
-        .filter(DecisionRun.request_id == case_uuid)
+        .filter(DecisionRun.request_id == caseId)
         .order_by(DecisionRun.created_at.desc())
         .first()
     )
@@ -690,23 +850,24 @@ def get_case(caseId: str, db: Session = Depends(get_db)):
         documents=[doc_to_out(d) for d in docs],
         evidencePacket=evidence_packet,
         decisionResult=decision_result_obj,
-        auditLog=build_audit_log(db, case_uuid),
+        auditLog=build_audit_log(db, caseId),
     )
 
 
 @app.post("/api/cases/{caseId}/documents", response_model=CaseOut)
 def add_documents(
-    caseId: str,
+    caseId: uuid.UUID,
     files: List[UploadFile] = File(...),
     background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db),
 ):
+    now = now_utc()
     req = db.query(Request).filter(Request.request_id == caseId).first()
     if not req:
         raise HTTPException(status_code=404, detail="Case not found")
 
     req.status = "extracting"
-    req.updated_at = now_utc()
+    req.updated_at = now
 
     log_event(
         request_id=str(req.request_id),
@@ -716,21 +877,7 @@ def add_documents(
         extra={"to": "extracting", "reason": "documents_added"},
     )
 
-    for f in files:
-        meta = save_upload(f)
-        db.add(
-            Document(
-                request_id=caseId,
-                filename=meta["filename"],
-                content_type=meta["content_type"],
-                sha256=meta["sha256"],
-                storage_uri=meta["storage_uri"],
-                size_bytes=meta["size_bytes"],
-                is_active=True,
-                created_at=now_utc(),
-                expires_at=now_utc() + timedelta(days=90),
-            )
-        )
+    insert_uploaded_documents(db, caseId, files, now)
 
     log_event(
         request_id=str(req.request_id),
@@ -749,23 +896,18 @@ def add_documents(
     )
 
     db.commit()
-    db.refresh(req)
     background_tasks.add_task(run_extraction_and_decision, str(req.request_id))
     return case_to_out(req, db)
 
 # links review to latest decision_run_id (if present)
 @app.post("/api/cases/{caseId}/review", response_model=CaseOut)
 def submit_review(
-    caseId: str,
+    caseId: uuid.UUID,
     body: ReviewIn,
     db: Session = Depends(get_db),
 ):
-    try:
-        case_uuid = uuid.UUID(caseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid caseId (must be a UUID)")
-
-    req = db.query(Request).filter(Request.request_id == case_uuid).first()
+    now = now_utc()
+    req = db.query(Request).filter(Request.request_id == caseId).first()
     if not req:
         raise HTTPException(status_code=404, detail="Case not found")
 
@@ -776,32 +918,24 @@ def submit_review(
     if req.assigned_reviewer_id and req.assigned_reviewer_id != body.reviewerId:
         raise HTTPException(status_code=403, detail="Reviewer not assigned to this case")
 
-    action_map = {
-        "APPROVE": "approve",
-        "DENY": "deny",
-        "REQUEST_INFO": "request_info",
-        "NEEDS_MORE_INFO": "request_info",
-        "APPROVE_WITH_BRIDGE": "approve_with_bridge",
-    }
-
-    action_db = action_map.get(body.action)
+    action_db = FE_TO_DB_ACTION.get(body.action)
     if not action_db:
         raise HTTPException(status_code=400, detail=f"Invalid action: {body.action}")
 
     latest_decision_run = (
         db.query(DecisionRun)
-        .filter(DecisionRun.request_id == case_uuid)
+        .filter(DecisionRun.request_id == caseId)
         .order_by(DecisionRun.created_at.desc())
         .first()
     )
 
     db.add(
         ReviewAction(
-            request_id=case_uuid,
+            request_id=caseId,
             reviewer_id=body.reviewerId,
             action=action_db,
             comment=body.comment,
-            created_at=now_utc(),
+            created_at=now,
             decision_run_id=latest_decision_run.decision_run_id if latest_decision_run else None,
         )
     )
@@ -826,7 +960,7 @@ def submit_review(
     # Increment review cycle so old committee data is preserved
     current_cycle = req.review_cycle or 1
     has_prior_committee = db.query(CommitteeAssignment).filter(
-        CommitteeAssignment.request_id == case_uuid
+        CommitteeAssignment.request_id == caseId
     ).first()
     if has_prior_committee:
         current_cycle += 1
@@ -840,20 +974,22 @@ def submit_review(
         .all()
     )
 
-    for member in eligible:
-        db.add(CommitteeAssignment(
-            request_id=case_uuid,
-            reviewer_id=member.reviewer_id,
-            review_cycle=req.review_cycle,
-        ))
-    log_event(event="CommitteeAssigned", request_id=str(case_uuid),
+    if eligible:
+        db.execute(
+            insert(CommitteeAssignment),
+            [
+                {"request_id": caseId, "reviewer_id": member.reviewer_id, "review_cycle": req.review_cycle}
+                for member in eligible
+            ],
+        )
+    log_event(event="CommitteeAssigned", request_id=str(caseId),
               actor="system", step="review",
               extra={"assigned_by": str(body.reviewerId),
                      "committee_members": [str(m.reviewer_id) for m in eligible],
                      "committee_size": len(eligible)})
 
     req.status = "pending_committee"
-    req.updated_at = now_utc()
+    req.updated_at = now
 
     log_event(
         request_id=str(req.request_id),
@@ -869,23 +1005,16 @@ def submit_review(
     )
 
     db.commit()
-    db.refresh(req)
     return case_to_out(req, db)
 
 
 @app.get("/api/cases/{caseId}/committee", response_model=CommitteeInfoOut)
 def get_committee(
-    caseId: str,
-    reviewerId: str = Query(...),
+    caseId: uuid.UUID,
+    reviewerId: uuid.UUID = Query(...),
     db: Session = Depends(get_db),
 ):
-    try:
-        case_uuid = uuid.UUID(caseId)
-        reviewer_uuid = uuid.UUID(reviewerId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid UUID")
-
-    req = db.query(Request).filter(Request.request_id == case_uuid).first()
+    req = db.query(Request).filter(Request.request_id == caseId).first()
     if not req:
         raise HTTPException(status_code=404, detail="Case not found")
 
@@ -895,8 +1024,8 @@ def get_committee(
     membership = (
         db.query(CommitteeAssignment)
         .filter(
-            CommitteeAssignment.request_id == case_uuid,
-            CommitteeAssignment.reviewer_id == reviewer_uuid,
+            CommitteeAssignment.request_id == caseId,
+            CommitteeAssignment.reviewer_id == reviewerId,
             CommitteeAssignment.review_cycle == current_cycle,
         )
         .first()
@@ -908,7 +1037,7 @@ def get_committee(
     assignments = (
         db.query(CommitteeAssignment)
         .filter(
-            CommitteeAssignment.request_id == case_uuid,
+            CommitteeAssignment.request_id == caseId,
             CommitteeAssignment.review_cycle == current_cycle,
         )
         .all()
@@ -918,7 +1047,7 @@ def get_committee(
     votes = (
         db.query(CommitteeVote)
         .filter(
-            CommitteeVote.request_id == case_uuid,
+            CommitteeVote.request_id == caseId,
             CommitteeVote.review_cycle == current_cycle,
         )
         .all()
@@ -938,7 +1067,7 @@ def get_committee(
     # Only show requesting reviewer's own vote
     my_vote = None
     for v in votes:
-        if v.voter_id == reviewer_uuid:
+        if v.voter_id == reviewerId:
             my_vote = {
                 "action": v.action,
                 "comment": v.comment,
@@ -972,16 +1101,12 @@ def get_committee(
 
 @app.post("/api/cases/{caseId}/committee/vote", response_model=CaseOut)
 def submit_committee_vote(
-    caseId: str,
+    caseId: uuid.UUID,
     body: CommitteeVoteIn,
     db: Session = Depends(get_db),
 ):
-    try:
-        case_uuid = uuid.UUID(caseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid caseId")
-
-    req = db.query(Request).filter(Request.request_id == case_uuid).first()
+    now = now_utc()
+    req = db.query(Request).filter(Request.request_id == caseId).first()
     if not req:
         raise HTTPException(status_code=404, detail="Case not found")
 
@@ -994,7 +1119,7 @@ def submit_committee_vote(
     membership = (
         db.query(CommitteeAssignment)
         .filter(
-            CommitteeAssignment.request_id == case_uuid,
+            CommitteeAssignment.request_id == caseId,
             CommitteeAssignment.reviewer_id == body.reviewerId,
             CommitteeAssignment.review_cycle == current_cycle,
         )
@@ -1007,7 +1132,7 @@ def submit_committee_vote(
     existing_vote = (
         db.query(CommitteeVote)
         .filter(
-            CommitteeVote.request_id == case_uuid,
+            CommitteeVote.request_id == caseId,
             CommitteeVote.voter_id == body.reviewerId,
             CommitteeVote.review_cycle == current_cycle,
         )
@@ -1018,16 +1143,16 @@ def submit_committee_vote(
 
     # Record vote
     db.add(CommitteeVote(
-        request_id=case_uuid,
+        request_id=caseId,
         voter_id=body.reviewerId,
         action=body.action,
         comment=body.comment,
         review_cycle=current_cycle,
-        created_at=now_utc(),
+        created_at=now,
     ))
     db.flush()
 
-    log_event(event="CommitteeVoteCast", request_id=str(case_uuid),
+    log_event(event="CommitteeVoteCast", request_id=str(caseId),
               actor="reviewer", step="committee",
               extra={"voter_id": str(body.reviewerId), "action": body.action,
                      "comment_preview": (body.comment[:160] + "…") if body.comment and len(body.comment) > 160 else body.comment})
@@ -1036,7 +1161,7 @@ def submit_committee_vote(
     total_members = (
         db.query(CommitteeAssignment)
         .filter(
-            CommitteeAssignment.request_id == case_uuid,
+            CommitteeAssignment.request_id == caseId,
             CommitteeAssignment.review_cycle == current_cycle,
         )
         .count()
@@ -1044,7 +1169,7 @@ def submit_committee_vote(
     total_votes = (
         db.query(CommitteeVote)
         .filter(
-            CommitteeVote.request_id == case_uuid,
+            CommitteeVote.request_id == caseId,
             CommitteeVote.review_cycle == current_cycle,
         )
         .count()
@@ -1055,7 +1180,7 @@ def submit_committee_vote(
         all_votes = (
             db.query(CommitteeVote)
             .filter(
-                CommitteeVote.request_id == case_uuid,
+                CommitteeVote.request_id == caseId,
                 CommitteeVote.review_cycle == current_cycle,
             )
             .all()
@@ -1075,16 +1200,16 @@ def submit_committee_vote(
             final_decision = "deny"
 
         req.status = "committee_decided"
-        req.updated_at = now_utc()
+        req.updated_at = now
 
         review_action_value = "request_info" if final_decision == "needs_more_info" else final_decision
         db.add(
             ReviewAction(
-                request_id=case_uuid,
+                request_id=caseId,
                 reviewer_id=body.reviewerId,
                 action=review_action_value,
                 comment=f"Committee decision: {final_decision.replace('_', ' ')}",
-                created_at=now_utc(),
+                created_at=now,
                 decision_run_id=None,
             )
         )
@@ -1104,7 +1229,6 @@ def submit_committee_vote(
         )
 
     db.commit()
-    db.refresh(req)
     return case_to_out(req, db)
 
 
@@ -1112,7 +1236,7 @@ def submit_committee_vote(
 def list_cases(
     status: Optional[str] = Query(None),
     studentId: Optional[str] = Query(None),
-    committeeReviewerId: Optional[str] = Query(None),
+    committeeReviewerId: Optional[uuid.UUID] = Query(None),
     db: Session = Depends(get_db),
 ):
     query = db.query(Request)
@@ -1124,15 +1248,11 @@ def list_cases(
         query = query.filter(Request.student_id == studentId)
 
     if committeeReviewerId:
-        try:
-            committee_uuid = uuid.UUID(committeeReviewerId)
-        except ValueError:
-            raise HTTPException(status_code=422, detail="Invalid committeeReviewerId")
         query = query.join(
             CommitteeAssignment,
             (CommitteeAssignment.request_id == Request.request_id)
             & (CommitteeAssignment.review_cycle == Request.review_cycle),
-        ).filter(CommitteeAssignment.reviewer_id == committee_uuid)
+        ).filter(CommitteeAssignment.reviewer_id == committeeReviewerId)
 
     cases = query.order_by(Request.created_at.desc()).all()
 
@@ -1140,20 +1260,15 @@ def list_cases(
 
 
 @app.post("/api/cases/{caseId}/extraction/start")
-def start_extraction(caseId: str, db: Session = Depends(get_db)):
-    try:
-        case_uuid = uuid.UUID(caseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid caseId (must be a UUID)")
-
-    req = db.query(Request).filter(Request.request_id == case_uuid).first()
+def start_extraction(caseId: uuid.UUID, db: Session = Depends(get_db)):
+    req = db.query(Request).filter(Request.request_id == caseId).first()
     if not req:
         raise HTTPException(status_code=404, detail="Case not found")
 
     docs = (
         db.query(Document)
-        .filter(Document.request_id == case_uuid, Document.is_active == True)
-        .order_by(Document.created_at.asc())
+        .filter(Document.request_id == caseId, Document.is_active == True)
+        .order_by(Document.created_at.asc(), Document.doc_id.asc())
         .all()
     )
     if not docs:
@@ -1164,36 +1279,35 @@ def start_extraction(caseId: str, db: Session = Depends(get_db)):
     db.commit()
 
     try:
-        extraction_run_id_str = run_extraction_pipeline(str(case_uuid))
+        extraction_run_id_str = run_extraction_pipeline(str(caseId))
     except Exception as e:
         db.expire_all()
-        req = db.query(Request).filter(Request.request_id == case_uuid).first()
+        req = db.query(Request).filter(Request.request_id == caseId).first()
         return {
             "message": "Extraction failed",
-            "caseId": caseId,
+            "caseId": str(caseId),
             "caseStatus": req.status if req else None,
             "error": str(e),
         }
 
     db.expire_all()
-    req = db.query(Request).filter(Request.request_id == case_uuid).first()
+    req = db.query(Request).filter(Request.request_id == caseId).first()
 
     if not req or req.status != "ready_for_decision":
         return {
             "message": "Extraction completed but case not ready_for_decision",
-            "caseId": caseId,
+            "caseId": str(caseId),
             "extractionRunId": extraction_run_id_str,
             "caseStatus": req.status if req else None,
         }
 
     extraction_run_uuid = uuid.UUID(extraction_run_id_str)
     try:
-        decision_run_id = run_decision_for_case_and_run(db, case_uuid, extraction_run_uuid)
+        decision_run_id = run_decision_for_case_and_run(db, caseId, extraction_run_uuid)
         db.commit()
-        db.refresh(req)
         return {
             "message": "Extraction completed + decision auto-triggered",
-            "caseId": caseId,
+            "caseId": str(caseId),
             "extractionRunId": str(extraction_run_uuid),
             "decisionRunId": str(decision_run_id),
             "caseStatus": req.status,
@@ -1202,23 +1316,27 @@ def start_extraction(caseId: str, db: Session = Depends(get_db)):
         db.rollback()
         return {
             "message": "Extraction completed but decision trigger failed",
-            "caseId": caseId,
+            "caseId": str(caseId),
             "extractionRunId": str(extraction_run_uuid),
             "error": str(e),
             "caseStatus": req.status if req else None,
         }
 
 
-@app.post("/api/cases/{caseId}/extraction/complete")
-def complete_extraction(caseId: str, body: ExtractionCompleteIn, db: Session = Depends(get_db)):
-    try:
-        case_uuid = uuid.UUID(caseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid caseId (must be a UUID)")
-
+def complete_extraction_run(
+    db: Session,
+    caseId: uuid.UUID,
+    extraction_run_id: uuid.UUID | str,
+    facts: List[ExtractionFactIn],
+) -> Dict[str, Any]:
+    """
+    Stores the facts of an active extraction run, marks it completed and triggers
+    the decision engine. Shared by /extraction/complete and /api/cases/pipeline.
+    """
+    now = now_utc()
     req = (
         db.query(Request)
-        .filter(Request.request_id == case_uuid)
+        .filter(Request.request_id == caseId)
         .with_for_update()
         .first()
     )
@@ -1228,8 +1346,8 @@ def complete_extraction(caseId: str, body: ExtractionCompleteIn, db: Session = D
     run = (
         db.query(ExtractionRun)
         .filter(
-            ExtractionRun.extraction_run_id == body.extractionRunId,
-            ExtractionRun.request_id == case_uuid,
+            ExtractionRun.extraction_run_id == extraction_run_id,
+            ExtractionRun.request_id == caseId,
         )
         .first()
     )
@@ -1242,150 +1360,66 @@ def complete_extraction(caseId: str, body: ExtractionCompleteIn, db: Session = D
     run.status = "completed"
 
     if run.started_at is None:
-        run.started_at = now_utc()
-
-    run.finished_at = now_utc()
-
-    inserted_evidence: list[GroundedEvidence] = []
-    for fact in body.facts:
-        ev = GroundedEvidence(
-            request_id=case_uuid,
-            extraction_run_id=run.extraction_run_id,
-            fact_type=fact.factType,
-            fact_key=fact.factKey,
-            fact_value=fact.factValue,
-            fact_json=fact.factJson,
-            unknown=fact.unknown,
-            created_at=now_utc(),
+        run.started_at = now
+
+    run.finished_at = now
+
+    # one multi-row INSERT instead of an ORM add() per fact; created_at steps by
+    # 1us per fact so readers keep submission order (later duplicate keys win)
+    if facts:
+        db.execute(
+            insert(GroundedEvidence),
+            [
+                {
+                    "request_id": caseId,
+                    "extraction_run_id": run.extraction_run_id,
+                    "fact_type": fact.factType,
+                    "fact_key": fact.factKey,
+                    "fact_value": fact.factValue,
+                    "fact_json": fact.factJson,
+                    "unknown": fact.unknown,
+                    "created_at": now + timedelta(microseconds=i),
+                }
+                for i, fact in enumerate(facts)
+            ],
         )
-        db.add(ev)
-        inserted_evidence.append(ev)
-
-    db.flush()
 
     req.status = "ready_for_decision"
-    req.updated_at = now_utc()
+    req.updated_at = now
 
-    evidence_rows = inserted_evidence
-
-    decision_run = DecisionRun(
-        request_id=req.request_id,
-        status="running",
-        started_at=now_utc(),
-        finished_at=None,
-        error_message=None,
-        decision_inputs=None,
-    )
-    db.add(decision_run)
-    db.flush()
+    # commit the extraction first so the FOR UPDATE lock on the request is not
+    # held for the whole (LLM-bound) decision run
+    extraction_run_id = run.extraction_run_id
+    db.commit()
 
     try:
-        packet = build_contracts_packet(req, evidence_rows)
-        packet_hash = compute_packet_hash(packet)
-
-        existing_completed = (
-            db.query(DecisionRun)
-            .filter(
-                DecisionRun.request_id == req.request_id,
-                DecisionRun.status == "completed",
-            )
-            .order_by(DecisionRun.created_at.desc())
-            .first()
-        )
-
-        if existing_completed and isinstance(existing_completed.decision_inputs, dict):
-            prev_hash = existing_completed.decision_inputs.get("inputs_hash")
-            prev_extraction_run_id = existing_completed.decision_inputs.get("extraction_run_id")
-            if prev_hash == packet_hash and prev_extraction_run_id == str(run.extraction_run_id):
-                decision_run.status = "completed"
-                decision_run.finished_at = now_utc()
-                db.commit()
-                return {
-                    "message": "Extraction completed (decision already up-to-date)",
-                    "extractionRunId": str(run.extraction_run_id),
-                    "factsInserted": len(body.facts),
-                    "decisionRunId": str(existing_completed.decision_run_id),
-                    "caseStatus": req.status,
-                }
-
-        decision_run.decision_inputs = packet.model_dump()
-        decision_run.decision_inputs["inputs_hash"] = packet_hash
-        decision_run.decision_inputs["extraction_run_id"] = str(run.extraction_run_id)
-
-        missing = validate_packet_or_raise(packet)
-        if missing:
-            synthetic_result_json = {
-                "decision": "NEEDS_MORE_INFO",
-                "equivalency_score": 0,
-                "confidence": "LOW",
-                "gaps": [{"text": m} for m in missing],
-                "missing_info_requests": missing,
-            }
-
-            db.add(
-                DecisionResult(
-                    decision_run_id=decision_run.decision_run_id,
-                    result_json=synthetic_result_json,
-                    needs_more_info=True,
-                    missing_fields={"missing_info_requests": missing},
-                )
-            )
-
-            decision_run.status = "completed"
-            decision_run.finished_at = now_utc()
-
-            req.status = "ai_recommendation"
-            req.updated_at = now_utc()
-
-        else:
-            # --- OLD deterministic decision engine (commented out) ---
-            # engine_result = decide(packet)
-            # --- END OLD ---
-
-            # --- NEW: LLM-based decision via OpenAI GPT ---
-            chunks_by_evidence = fetch_chunks_by_evidence(db, evidence_rows)
-            engine_result = call_llm_decision(packet, evidence_rows, chunks_by_evidence)
-            # --- END NEW ---
-
-            needs_more_info = (engine_result.decision.value == "NEEDS_MORE_INFO")
-            missing_fields = (
-                {"missing_info_requests": engine_result.missing_info_requests}
-                if engine_result.missing_info_requests
-                else None
-            )
-
-            db.add(
-                DecisionResult(
-                    decision_run_id=decision_run.decision_run_id,
-                    result_json=engine_result.model_dump(),
-                    needs_more_info=needs_more_info,
-                    missing_fields=missing_fields,
-                )
-            )
-
-            decision_run.status = "completed"
-            decision_run.finished_at = now_utc()
-
-            req.status = "ai_recommendation"
-            req.updated_at = now_utc()
-
-    except Exception as ex:
-        decision_run.status = "failed"
-        decision_run.error_message = str(ex)
-        decision_run.finished_at = now_utc()
-
-        req.status = "invalid"
-        req.updated_at = now_utc()
+        # an extraction that reported no facts still gets a (NEEDS_MORE_INFO) decision
+        decision_run_id = run_decision_for_case_and_run(db, caseId, extraction_run_id, allow_empty_evidence=True)
+        db.commit()
+        return {
+            "message": "Extraction completed (decision engine triggered)",
+            "extractionRunId": str(extraction_run_id),
+            "factsInserted": len(facts),
+            "decisionRunId": str(decision_run_id),
+            "caseStatus": req.status,
+        }
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        return {
+            "message": "Extraction completed but decision trigger failed",
+            "extractionRunId": str(extraction_run_id),
+            "factsInserted": len(facts),
+            "error": str(e),
+            "caseStatus": req.status,
+        }
 
-    db.commit()
 
-    return {
-        "message": "Extraction completed (decision engine triggered)",
-        "extractionRunId": str(run.extraction_run_id),
-        "factsInserted": len(body.facts),
-        "decisionRunId": str(decision_run.decision_run_id),
-        "caseStatus": req.status,
-    }
+@app.post("/api/cases/{caseId}/extraction/complete")
+def complete_extraction(caseId: uuid.UUID, body: ExtractionCompleteIn, db: Session = Depends(get_db)):
+    return complete_extraction_run(db, caseId, body.extractionRunId, body.facts)
 
 
 def build_decision_inputs(case: Request, docs: list[Document], evidence: list[GroundedEvidence]) -> dict:
@@ -1396,8 +1430,8 @@ def build_decision_inputs(case: Request, docs: list[Document], evidence: list[Gr
             "studentName": case.student_name,
             "courseRequested": case.course_requested,
             "status": case.status,
-            "createdAt": case.created_at.isoformat() if case.created_at else None,
-            "updatedAt": case.updated_at.isoformat() if case.updated_at else None,
+            "createdAt": case.created_at,
+            "updatedAt": case.updated_at,
         },
         "documents": [
             {
@@ -1407,7 +1441,7 @@ def build_decision_inputs(case: Request, docs: list[Document], evidence: list[Gr
                 "sha256": d.sha256,
                 "storageUri": d.storage_uri,
                 "sizeBytes": d.size_bytes,
-                "createdAt": d.created_at.isoformat() if d.created_at else None,
+                "createdAt": d.created_at,
                 "isActive": d.is_active,
             }
             for d in docs
@@ -1421,7 +1455,7 @@ def build_decision_inputs(case: Request, docs: list[Document], evidence: list[Gr
                 "factValue": e.fact_value,
                 "factJson": e.fact_json,
                 "unknown": e.unknown,
-                "createdAt": e.created_at.isoformat() if e.created_at else None,
+                "createdAt": e.created_at,
             }
             for e in evidence
         ],
@@ -1429,13 +1463,8 @@ def build_decision_inputs(case: Request, docs: list[Document], evidence: list[Gr
 
 
 @app.post("/api/cases/{caseId}/decision/run")
-def decision_run(caseId: str, db: Session = Depends(get_db)):
-    try:
-        case_uuid = uuid.UUID(caseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid caseId (must be a UUID)")
-
-    case = db.query(Request).filter(Request.request_id == case_uuid).first()
+def decision_run(caseId: uuid.UUID, db: Session = Depends(get_db)):
+    case = db.query(Request).filter(Request.request_id == caseId).first()
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
 
@@ -1450,18 +1479,19 @@ def decision_run(caseId: str, db: Session = Depends(get_db)):
 
     docs = (
         db.query(Document)
-        .filter(Document.request_id == case_uuid, Document.is_active == True)
-        .order_by(Document.created_at.asc())
+        .filter(Document.request_id == caseId, Document.is_active == True)
+        .order_by(Document.created_at.asc(), Document.doc_id.asc())
         .all()
     )
     if not docs:
         raise HTTPException(status_code=409, detail="No active documents for this case")
 
+    # Only existence matters here; the decision run reloads the evidence it scores.
     evidence = (
         db.query(GroundedEvidence)
-        .filter(GroundedEvidence.request_id == case_uuid)
-        .order_by(GroundedEvidence.created_at.asc())
-        .all()
+        .options(load_only(GroundedEvidence.evidence_id))
+        .filter(GroundedEvidence.request_id == caseId)
+        .first()
     )
     if not evidence:
         raise HTTPException(status_code=409, detail="No grounded evidence for this case")
@@ -1470,7 +1500,7 @@ def decision_run(caseId: str, db: Session = Depends(get_db)):
     latest_extraction = (
         db.query(ExtractionRun)
         .filter(
-            ExtractionRun.request_id == case_uuid,
+            ExtractionRun.request_id == caseId,
             ExtractionRun.status == "completed",
         )
         .order_by(ExtractionRun.created_at.desc())
@@ -1482,31 +1512,26 @@ def decision_run(caseId: str, db: Session = Depends(get_db)):
     extraction_run_id = latest_extraction.extraction_run_id
 
     # Use the main decision flow which calls the LLM
-    decision_run_id = run_decision_for_case_and_run(db, case_uuid, extraction_run_id)
+    decision_run_id = run_decision_for_case_and_run(db, caseId, extraction_run_id)
     db.commit()
 
     return {
         "message": "LLM decision completed",
-        "caseId": str(case_uuid),
+        "caseId": str(caseId),
         "decisionRunId": str(decision_run_id),
         "status": case.status,
     }
 
 
 @app.get("/api/cases/{caseId}/decision/result/latest")
-def get_latest_decision_result(caseId: str, db: Session = Depends(get_db)):
-    try:
-        case_uuid = uuid.UUID(caseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid caseId (must be a UUID)")
-
-    req = db.query(Request).filter(Request.request_id == case_uuid).first()
+def get_latest_decision_result(caseId: uuid.UUID, db: Session = Depends(get_db)):
+    req = db.query(Request).filter(Request.request_id == caseId).first()
     if not req:
         raise HTTPException(status_code=404, detail="Case not found")
 
     dr = (
         db.query(DecisionRun)
-        .filter(DecisionRun.request_id == case_uuid)
+        .filter(DecisionRun.request_id == caseId)
         .order_by(DecisionRun.created_at.desc())
         .first()
     )
@@ -1534,30 +1559,24 @@ def get_latest_decision_result(caseId: str, db: Session = Depends(get_db)):
 
     latest_review = (
         db.query(ReviewAction)
-        .filter(ReviewAction.request_id == case_uuid)
+        .filter(ReviewAction.request_id == caseId)
         .order_by(ReviewAction.created_at.desc())
         .first()
     )
 
     review_action_api = None
     if latest_review:
-        reverse_action_map = {
-            "approve": "APPROVE",
-            "deny": "DENY",
-            "request_info": "NEEDS_MORE_INFO",
-            "approve_with_bridge": "APPROVE_WITH_BRIDGE",
-        }
         review_action_api = {
             "reviewActionId": str(latest_review.review_action_id),
             "reviewerId": latest_review.reviewer_id,
-            "reviewerDecision": reverse_action_map.get(latest_review.action, latest_review.action),
+            "reviewerDecision": DB_TO_FE_ACTION.get(latest_review.action, latest_review.action),
             "comment": latest_review.comment,
             "createdAt": latest_review.created_at,
             "decisionRunId": str(latest_review.decision_run_id) if latest_review.decision_run_id else None,
         }
 
     return {
-        "caseId": str(case_uuid),
+        "caseId": str(caseId),
         "caseStatus": req.status,
         "decisionRunId": str(dr.decision_run_id),
         "decisionStatus": dr.status,
@@ -1572,70 +1591,115 @@ def get_latest_decision_result(caseId: str, db: Session = Depends(get_db)):
 
 
 @app.post("/api/cases/{caseId}/decision/result")
-def store_decision_result(caseId: str, body: DecisionResultIn, db: Session = Depends(get_db)):
-    try:
-        case_uuid = uuid.UUID(caseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid caseId (must be UUID)")
-
-    case = db.query(Request).filter(Request.request_id == case_uuid).first()
-    if not case:
-        raise HTTPException(status_code=404, detail="Case not found")
-
+def store_decision_result(caseId: uuid.UUID, body: DecisionResultIn, db: Session = Depends(get_db)):
     try:
         run_uuid = uuid.UUID(body.decisionRunId)
     except ValueError:
         raise HTTPException(status_code=422, detail="Invalid decisionRunId (must be UUID)")
 
-    run = (
-        db.query(DecisionRun)
-        .filter(
-            DecisionRun.decision_run_id == run_uuid,
-            DecisionRun.request_id == case_uuid,
+    # case and run in one round-trip; the outer join lets a missing run be told
+    # apart from a missing case for the 404s below
+    row = db.execute(
+        select(Request.request_id, DecisionRun.decision_run_id)
+        .outerjoin(
+            DecisionRun,
+            (DecisionRun.request_id == Request.request_id)
+            & (DecisionRun.decision_run_id == run_uuid),
         )
-        .first()
-    )
-    if not run:
+        .where(Request.request_id == caseId)
+    ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Case not found")
+
+    _, run_id = row
+    if not run_id:
         raise HTTPException(status_code=404, detail="Decision run not found for this case")
 
-    existing = db.query(DecisionResult).filter(DecisionResult.decision_run_id == run_uuid).first()
-    if existing:
-        existing.result_json = body.resultJson
-        existing.needs_more_info = body.needsMoreInfo
-        existing.missing_fields = body.missingFields
-    else:
-        db.add(
-            DecisionResult(
-                decision_run_id=run_uuid,
-                result_json=body.resultJson,
-                needs_more_info=body.needsMoreInfo,
-                missing_fields=body.missingFields,
-            )
+    stmt = pg_insert(DecisionResult).values(
+        decision_run_id=run_uuid,
+        result_json=body.resultJson,
+        needs_more_info=body.needsMoreInfo,
+        missing_fields=body.missingFields,
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[DecisionResult.decision_run_id],
+            set_={
+                "result_json": stmt.excluded.result_json,
+                "needs_more_info": stmt.excluded.needs_more_info,
+                "missing_fields": stmt.excluded.missing_fields,
+            },
         )
+    )
 
-    case.status = "ai_recommendation"
-    case.updated_at = now_utc()
+    case_status = "ai_recommendation"
+    db.execute(
+        update(Request)
+        .where(Request.request_id == caseId)
+        .values(status=case_status, updated_at=now_utc())
+    )
 
     db.commit()
 
     return {
         "message": "Decision result stored",
-        "caseId": str(case_uuid),
+        "caseId": str(caseId),
         "decisionRunId": str(run_uuid),
-        "caseStatus": case.status,
+        "caseStatus": case_status,
     }
 
 
 # Decision Engine
 
-def _first_non_empty(*vals):
-    for v in vals:
-        if v is None:
-            continue
-        if isinstance(v, str) and not v.strip():
-            continue
-        return v
-    return None
+def _is_blank(v: Any) -> bool:
+    return v is None or (isinstance(v, str) and not v.strip())
+
+
+def _evidence_value(fact_json: Any, fact_value: Any) -> Any:
+    """fact_json if it is set, else fact_value, else None (blank strings count as unset)."""
+    if not _is_blank(fact_json):
+        return fact_json
+    return None if _is_blank(fact_value) else fact_value
+
+
+# evidence fact_key (or fact_type) synonym -> CourseEvidence field
+EVIDENCE_FIELD_MAP = {
+    "credits": "credits",
+    "credit_hours": "credits",
+    "units": "credits",
+    "credits_or_units": "credits",
+    "contact_hours_lecture": "contact_hours_lecture",
+    "lecture_hours": "contact_hours_lecture",
+    "lecture_contact_hours": "contact_hours_lecture",
+    "contact_hours_lab": "contact_hours_lab",
+    "lab_hours": "contact_hours_lab",
+    "lab_contact_hours": "contact_hours_lab",
+    "lab_component": "lab_component",
+    "has_lab": "lab_component",
+    "lab_required": "lab_component",
+    "includes_lab": "lab_component",
+    "topics": "topics",
+    "course_topics": "topics",
+    "outcomes": "outcomes",
+    "learning_outcomes": "outcomes",
+    "slos": "outcomes",
+    "assessments": "assessments",
+    "evaluation_methods": "assessments",
+    "grading_components": "assessments",
+}
+
+_LAB_TRUE = frozenset({"true", "yes", "y", "1"})
+_LAB_FALSE = frozenset({"false", "no", "n", "0"})
+
+
+def _coerce_lab(v: Any) -> Any:
+    if isinstance(v, str):
+        s = v.strip().lower()
+        if s in _LAB_TRUE:
+            return True
+        if s in _LAB_FALSE:
+            return False
+    return v
 
 
 def map_evidence_rows_to_course_evidence(evidence_rows: list[GroundedEvidence]) -> CourseEvidence:
@@ -1649,63 +1713,58 @@ def map_evidence_rows_to_course_evidence(evidence_rows: list[GroundedEvidence])
         "assessments": EvidenceField(value=None, unknown=True, citations=[]),
     }
 
-    def key_of(e: GroundedEvidence) -> str:
-        return (e.fact_key or e.fact_type or "").strip().lower()
-
     for e in evidence_rows:
-        k = key_of(e)
+        # trg_evidence_normalize_keys stores keys trimmed + lower-cased, but databases
+        # without the trigger may still hold raw keys, so normalize here too
+        field = EVIDENCE_FIELD_MAP.get((e.fact_key or e.fact_type or "").strip().lower())
+        if field is None:
+            continue
 
-        v = _first_non_empty(e.fact_json, e.fact_value)
+        v = _evidence_value(e.fact_json, e.fact_value)
         if isinstance(v, dict) and "items" in v and isinstance(v["items"], list):
             v = v["items"]
+        if field == "lab_component":
+            v = _coerce_lab(v)
 
-        if k in {"credits", "credit_hours", "units", "credits_or_units"}:
-            fields["credits"] = EvidenceField(value=v, unknown=bool(e.unknown), citations=[])
-            continue
-
-        if k in {"contact_hours_lecture", "lecture_hours", "lecture_contact_hours"}:
-            fields["contact_hours_lecture"] = EvidenceField(value=v, unknown=bool(e.unknown), citations=[])
-            continue
+        fields[field] = EvidenceField(value=v, unknown=bool(e.unknown), citations=[])
 
-        if k in {"contact_hours_lab", "lab_hours", "lab_contact_hours"}:
-            fields["contact_hours_lab"] = EvidenceField(value=v, unknown=bool(e.unknown), citations=[])
-            continue
-
-        if k in {"lab_component", "has_lab", "lab_required", "includes_lab"}:
-            lab_val = v
-            if isinstance(lab_val, str):
-                s = lab_val.strip().lower()
-                if s in {"true", "yes", "y", "1"}:
-                    lab_val = True
-                elif s in {"false", "no", "n", "0"}:
-                    lab_val = False
-            fields["lab_component"] = EvidenceField(value=lab_val, unknown=bool(e.unknown), citations=[])
-            continue
+    return CourseEvidence(**fields)
 
-        if k in {"topics", "course_topics"}:
-            fields["topics"] = EvidenceField(value=v, unknown=bool(e.unknown), citations=[])
-            continue
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config")
 
-        if k in {"outcomes", "learning_outcomes", "slos"}:
-            fields["outcomes"] = EvidenceField(value=v, unknown=bool(e.unknown), citations=[])
-            continue
 
-        if k in {"assessments", "evaluation_methods", "grading_components"}:
-            fields["assessments"] = EvidenceField(value=v, unknown=bool(e.unknown), citations=[])
-            continue
+# config file name -> (mtime_ns, parsed value); rebuilt only when the file changes
+_CONFIG_CACHE: Dict[str, tuple] = {}
 
-    return CourseEvidence(**fields)
 
-CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config")
+def _cached_config(name: str, build):
+    """
+    Return build(path) for config/<name>, reusing the previous result until the
+    file's mtime changes or the entry is evicted (PUT /api/policy does both).
+    """
+    path = os.path.join(CONFIG_DIR, name)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    hit = _CONFIG_CACHE.get(name)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    value = build(path)
+    _CONFIG_CACHE[name] = (mtime, value)
+    return value
 
 
-def load_policy_config() -> PolicyConfig:
-    path = os.path.join(CONFIG_DIR, "policy.yaml")
+def _build_policy_config(path: str) -> PolicyConfig:
     with open(path, "r", encoding="utf-8") as f:
         data = yaml.safe_load(f) or {}
     return PolicyConfig(**data)
 
 
+def load_policy_config() -> PolicyConfig:
+    return _cached_config("policy.yaml", _build_policy_config)
+
+
 def _normalize_course_code(code: Optional[str]) -> str:
     """Normalize 'NURS 2260 - Pathophysiology', 'cpsc 2150', 'CPSC-2150' -> 'CPSC-2150'.
     Strips display name after the code (e.g. '- Pathophysiology')."""
@@ -1724,39 +1783,49 @@ def _normalize_course_code(code: Optional[str]) -> str:
     return s
 
 
-def load_target_profile(course_requested: Optional[str]) -> TargetCourseProfile:
-    """
-    Look up the requested course in config/target_courses.yaml. Falls back to a
-    permissive default profile if the course is not configured.
-    """
-    path = os.path.join(CONFIG_DIR, "target_courses.yaml")
+# permissive profile — GPT handles per-target reasoning via its prompt,
+# and the rule engine gives full credit for components with no requirements.
+FALLBACK_TARGET_PROFILE = TargetCourseProfile(
+    target_credits=3,
+    target_lab_required=False,
+    required_topics=[],
+    required_outcomes=[],
+)
+
+
+def _build_target_profiles(path: str) -> Dict[str, TargetCourseProfile]:
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f) or {}
     except FileNotFoundError:
         data = {}
 
-    targets = (data.get("targets") or {})
-    code = _normalize_course_code(course_requested)
-
-    profile_data = targets.get(code)
-    if profile_data:
-        return TargetCourseProfile(
+    return {
+        code: TargetCourseProfile(
             target_credits=profile_data.get("target_credits", 3),
             target_lab_required=bool(profile_data.get("target_lab_required", False)),
             required_topics=profile_data.get("required_topics", []) or [],
             required_outcomes=profile_data.get("required_outcomes", []) or [],
         )
+        for code, profile_data in (data.get("targets") or {}).items()
+        if profile_data
+    }
+
+
+def load_target_profile(course_requested: Optional[str]) -> TargetCourseProfile:
+    """
+    Look up the requested course in config/target_courses.yaml. Falls back to a
+    permissive default profile if the course is not configured.
+    """
+    targets = _cached_config("target_courses.yaml", _build_target_profiles)
+    code = _normalize_course_code(course_requested)
+
+    profile = targets.get(code)
+    if profile:
+        return profile
 
-    # fallback: permissive profile — GPT handles per-target reasoning via its prompt,
-    # and the rule engine gives full credit for components with no requirements.
     print(f"[build_contracts_packet] No target profile for '{course_requested}' (normalized '{code}'); using fallback.")
-    return TargetCourseProfile(
-        target_credits=3,
-        target_lab_required=False,
-        required_topics=[],
-        required_outcomes=[],
-    )
+    return FALLBACK_TARGET_PROFILE
 
 
 def build_contracts_packet(case: Request, evidence_rows: list[GroundedEvidence]) -> DecisionInputsPacket:
@@ -1807,61 +1876,66 @@ def fetch_chunks_by_evidence(db: Session, evidence_rows) -> dict:
     return result
 
 
+_EMPTY_VALUES = (None, "", [])
+
+
+def _is_missing(ef: EvidenceField) -> bool:
+    return ef.unknown or ef.value in _EMPTY_VALUES
+
+
 def validate_packet_or_raise(packet: DecisionInputsPacket) -> list[str]:
+    policy = packet.policy
+    if not (policy.require_credits_known or policy.require_topics_or_outcomes):
+        return []
+
     missing: list[str] = []
     src = packet.source_course
-    policy = packet.policy
 
-    if policy.require_credits_known:
-        if src.credits.unknown or src.credits.value in (None, "", []):
-            missing.append("Missing source course credits.")
+    if policy.require_credits_known and _is_missing(src.credits):
+        missing.append("Missing source course credits.")
 
-    if policy.require_topics_or_outcomes:
-        topics_missing = src.topics.unknown or not src.topics.value
-        outcomes_missing = src.outcomes.unknown or not src.outcomes.value
-        if topics_missing and outcomes_missing:
-            missing.append("Missing source course topics and learning outcomes.")
+    if policy.require_topics_or_outcomes and (src.topics.unknown or not src.topics.value) \
+            and (src.outcomes.unknown or not src.outcomes.value):
+        missing.append("Missing source course topics and learning outcomes.")
 
     return missing
 
 
-def stable_json_dumps(obj: Any) -> str:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-
-
-def sha256_str(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+def compute_packet_hash(packet: DecisionInputsPacket) -> str:
+    """
+    Hash of the packet's JSON, memoized on the packet. pydantic-core writes the
+    bytes directly, without building a Python dict first. Field order follows the
+    model declarations, and fact_json key order is whatever JSONB returns: packets
+    are only ever built from evidence reloaded from the database.
+    blake2b is only used for dedup, not security, and is cheaper than sha256.
+    """
+    if packet._inputs_hash is None:
+        payload = packet.model_dump_json().encode("utf-8")
+        packet._inputs_hash = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return packet._inputs_hash
 
 
-def compute_packet_hash(packet: DecisionInputsPacket) -> str:
-    payload = packet.model_dump()
-    return sha256_str(stable_json_dumps(payload))
+DECISION_WHY = {
+    "APPROVE": "The source course meets the credit and content requirements under the current policy.",
+    "APPROVE_WITH_BRIDGE": "The source course is close to equivalent but requires bridging requirements.",
+    "DENY": "The source course does not meet the minimum equivalency threshold under the current policy.",
+    "NEEDS_MORE_INFO": "The request is missing required evidence needed to evaluate equivalency.",
+}
 
 
 def generate_decision_packet(engine_result) -> dict:
     decision = engine_result.decision.value
 
-    if decision == "APPROVE":
-        why = "The source course meets the credit and content requirements under the current policy."
-    elif decision == "APPROVE_WITH_BRIDGE":
-        why = "The source course is close to equivalent but requires bridging requirements."
-    elif decision == "DENY":
-        why = "The source course does not meet the minimum equivalency threshold under the current policy."
-    elif decision == "NEEDS_MORE_INFO":
-        why = "The request is missing required evidence needed to evaluate equivalency."
-    else:
-        why = "No recommendation available."
-
     return {
         "decision": decision,
         "equivalency_score": engine_result.equivalency_score,
         "confidence": engine_result.confidence.value,
-        "why": why,
+        "why": DECISION_WHY.get(decision, "No recommendation available."),
         "gaps": [
-            g.model_dump() if hasattr(g, "model_dump") else g
-            for g in (engine_result.gaps or [])
+            g.model_dump() if isinstance(g, BaseModel) else g
+            for g in (engine_result.gaps or ())
         ],
-        "missing_info_requests": list(engine_result.missing_info_requests or []),
+        "missing_info_requests": list(engine_result.missing_info_requests or ()),
         "citations": [],
     }
 
@@ -1900,14 +1974,9 @@ def login(body: LoginIn, db: Session = Depends(get_db)):
 
 
 @app.get("/api/auth/me", response_model=LoginOut)
-def get_me(reviewerId: str = Query(...), db: Session = Depends(get_db)):
+def get_me(reviewerId: uuid.UUID = Query(...), db: Session = Depends(get_db)):
     """Return the current user's profile by reviewerId. Frontend calls this on page load."""
-    try:
-        rid = uuid.UUID(reviewerId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid reviewerId")
-
-    r = db.query(Reviewer).filter(Reviewer.reviewer_id == rid).first()
+    r = db.query(Reviewer).filter(Reviewer.reviewer_id == reviewerId).first()
     if not r or r.is_deleted:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -1981,6 +2050,8 @@ def update_policy(body: PolicyUpdateIn):
         d["must_include_topics"] = body.mustIncludeTopics
 
     _write_policy_yaml(d)
+    # mtime may not tick on coarse-resolution filesystems, so don't rely on it here
+    _CONFIG_CACHE.pop("policy.yaml", None)
 
     log_event(event="PolicyUpdated", actor="admin", step="admin",
               extra={"approve_threshold": d.get("approve_threshold"),
@@ -2031,7 +2102,6 @@ def create_reviewer(body: ReviewerCreateIn, db: Session = Depends(get_db)):
     )
     db.add(r)
     db.commit()
-    db.refresh(r)
 
     log_event(event="ReviewerCreated", actor="admin", step="admin",
           extra={"reviewer_id": str(r.reviewer_id), "utc_id": r.utc_id, "role": r.role or "reviewer"})
@@ -2048,13 +2118,8 @@ def create_reviewer(body: ReviewerCreateIn, db: Session = Depends(get_db)):
 
 
 @app.get("/api/reviewers/{reviewerId}", response_model=ReviewerOut)
-def get_reviewer(reviewerId: str, db: Session = Depends(get_db)):
-    try:
-        reviewer_uuid = uuid.UUID(reviewerId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid reviewerId (must be a UUID)")
-
-    r = db.query(Reviewer).filter(Reviewer.reviewer_id == reviewer_uuid).first()
+def get_reviewer(reviewerId: uuid.UUID, db: Session = Depends(get_db)):
+    r = db.query(Reviewer).filter(Reviewer.reviewer_id == reviewerId).first()
     if not r:
         raise HTTPException(status_code=404, detail="Reviewer not found")
 
@@ -2118,7 +2183,6 @@ def create_course(body: CourseIn, db: Session = Depends(get_db)):
     )
     db.add(c)
     db.commit()
-    db.refresh(c)
 
     return CourseOut(
         courseId=str(c.course_id),
@@ -2137,13 +2201,8 @@ def create_course(body: CourseIn, db: Session = Depends(get_db)):
 
 
 @app.get("/api/courses/{courseId}", response_model=CourseOut)
-def get_course(courseId: str, db: Session = Depends(get_db)):
-    try:
-        cid = uuid.UUID(courseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid courseId (must be a UUID)")
-
-    c = db.query(Course).filter(Course.course_id == cid).first()
+def get_course(courseId: uuid.UUID, db: Session = Depends(get_db)):
+    c = db.query(Course).filter(Course.course_id == courseId).first()
     if not c:
         raise HTTPException(status_code=404, detail="Course not found")
 
@@ -2164,13 +2223,8 @@ def get_course(courseId: str, db: Session = Depends(get_db)):
 
 
 @app.put("/api/courses/{courseId}", response_model=CourseOut)
-def update_course(courseId: str, body: CourseUpdateIn, db: Session = Depends(get_db)):
-    try:
-        cid = uuid.UUID(courseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid courseId (must be a UUID)")
-
-    c = db.query(Course).filter(Course.course_id == cid).first()
+def update_course(courseId: uuid.UUID, body: CourseUpdateIn, db: Session = Depends(get_db)):
+    c = db.query(Course).filter(Course.course_id == courseId).first()
     if not c:
         raise HTTPException(status_code=404, detail="Course not found")
 
@@ -2193,7 +2247,6 @@ def update_course(courseId: str, body: CourseUpdateIn, db: Session = Depends(get
 
     c.updated_at = now_utc()
     db.commit()
-    db.refresh(c)
 
     return CourseOut(
         courseId=str(c.course_id),
@@ -2212,13 +2265,8 @@ def update_course(courseId: str, body: CourseUpdateIn, db: Session = Depends(get
 
 
 @app.delete("/api/courses/{courseId}", status_code=204)
-def delete_course(courseId: str, db: Session = Depends(get_db)):
-    try:
-        cid = uuid.UUID(courseId)
-    except ValueError:
-        raise HTTPException(status_code=422, detail="Invalid courseId (must be a UUID)")
-
-    c = db.query(Course).filter(Course.course_id == cid).first()
+def delete_course(courseId: uuid.UUID, db: Session = Depends(get_db)):
+    c = db.query(Course).filter(Course.course_id == courseId).first()
     if not c:
         raise HTTPException(status_code=404, detail="Course not found")
 
@@ -2283,10 +2331,10 @@ def seed_courses_from_csv(db: Session = Depends(get_db)):
 
 
 @app.delete("/api/cases/{case_id}")
-def delete_case(case_id: str, db: Session = Depends(get_db)):
-    req = db.query(Request).filter(Request.request_id == uuid.UUID(case_id)).first()
+def delete_case(case_id: uuid.UUID, db: Session = Depends(get_db)):
+    req = db.query(Request).filter(Request.request_id == case_id).first()
     if not req:
         raise HTTPException(status_code=404, detail="Case not found.")
     db.delete(req)
     db.commit()
-    return {"message": "Case deleted successfully.", "caseId": case_id}
\ No newline at end of file
+    return {"message": "Case deleted successfully.", "caseId": str(case_id)}
\ No newline at end of file
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Text, Boolean, ForeignKey, Integer, String
+from sqlalchemy import Column, Computed, DateTime, Text, Boolean, ForeignKey, Integer, String
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
@@ -100,6 +100,7 @@ class DecisionRun(Base):
     error_message = Column(Text)
 
     decision_inputs = Column(JSONB)
+    inputs_hash = Column(Text, Computed("decision_inputs->>'inputs_hash'", persisted=True))
 
 
 class ReviewAction(Base):
@@ -184,6 +185,9 @@ class Reviewer(Base):
 
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=text("NOW()"))
 
+    # fetch server defaults via INSERT ... RETURNING so create endpoints need no refresh
+    __mapper_args__ = {"eager_defaults": True}
+
 
 class Course(Base):
     __tablename__ = "courses"
@@ -200,3 +204,5 @@ class Course(Base):
     description = Column(Text)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=text("NOW()"))
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=text("NOW()"))
+
+    __mapper_args__ = {"eager_defaults": True}
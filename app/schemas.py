@@ -1,8 +1,12 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Literal, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 
+class FrozenOut(BaseModel):
+    # response models are built once per request and never edited afterwards
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 class ReviewIn(BaseModel):
     action: Literal["APPROVE", "DENY", "REQUEST_INFO", "NEEDS_MORE_INFO", "APPROVE_WITH_BRIDGE"]
     comment: str = ""
@@ -14,7 +18,7 @@ class ReviewerCreateIn(BaseModel):
     password: Optional[str] = None
     role: Literal["reviewer", "admin", "committee"] = "reviewer"
 
-class ReviewerOut(BaseModel):
+class ReviewerOut(FrozenOut):
     reviewerId: str
     reviewerName: Optional[str]
     utcId: str
@@ -23,7 +27,7 @@ class ReviewerOut(BaseModel):
     isDeleted: bool
     createdAt: datetime
 
-class CaseOut(BaseModel):
+class CaseOut(FrozenOut):
     caseId: str
     studentId: str
     studentName: Optional[str]
@@ -36,7 +40,7 @@ class CaseOut(BaseModel):
     updatedAt: datetime
 
 
-class DocumentOut(BaseModel):
+class DocumentOut(FrozenOut):
     docId: str
     filename: str
     sha256: str
@@ -46,25 +50,13 @@ class DocumentOut(BaseModel):
     expiresAt: Optional[datetime] = None
 
 
-class CaseDetailOut(BaseModel):
+class CaseDetailOut(FrozenOut):
     case: CaseOut
     documents: List[DocumentOut]
     evidencePacket: Dict[str, Any]
     decisionResult: Optional[Dict[str, Any]] = None
     auditLog: Dict[str, Any]
 
-class ExtractionStartDocOut(BaseModel):
-    docId: str
-    filename: str
-    sha256: str
-    storageUri: str
-
-class ExtractionStartOut(BaseModel):
-    extractionRunId: str
-    caseId: str
-    status: str
-    documents: List[ExtractionStartDocOut]
-
 class ExtractionFactIn(BaseModel):
     factType: str
     factKey: Optional[str] = None
@@ -89,13 +81,13 @@ class CommitteeVoteIn(BaseModel):
     comment: str = ""
 
 
-class CommitteeMemberOut(BaseModel):
+class CommitteeMemberOut(FrozenOut):
     reviewerId: str
     reviewerName: Optional[str]
     hasVoted: bool
 
 
-class CommitteeInfoOut(BaseModel):
+class CommitteeInfoOut(FrozenOut):
     members: List[CommitteeMemberOut]
     myVote: Optional[Dict[str, Any]] = None
     finalDecision: Optional[str] = None
@@ -113,7 +105,7 @@ class CourseIn(BaseModel):
     description: Optional[str] = None
 
 
-class CourseOut(BaseModel):
+class CourseOut(FrozenOut):
     courseId: str
     courseCode: str
     displayName: str
@@ -144,14 +136,14 @@ class LoginIn(BaseModel):
     password: str
 
 
-class LoginOut(BaseModel):
+class LoginOut(FrozenOut):
     reviewerId: str
     reviewerName: Optional[str]
     utcId: str
     role: str
 
 
-class PolicyOut(BaseModel):
+class PolicyOut(FrozenOut):
     # Score band thresholds (0-100)
     approveThreshold: int
     bridgeThreshold: int
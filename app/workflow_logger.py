@@ -2,34 +2,128 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import atexit
 import json
+import logging
 import os
+import queue
+import threading
 from pathlib import Path
 from typing import Any, Optional
 
 _RETENTION_DAYS: int = int(os.getenv("LOG_RETENTION_DAYS", "1825"))
+_RETENTION = timedelta(days=_RETENTION_DAYS)
 
 _LOG_PATH: Optional[Path] = None
+_MAX_BYTES = 10_000_000
+_BACKUP_COUNT = 5
+
+# Events go through stdlib logging: log_event only enqueues the record, and a
+# QueueListener thread formats it and writes it to a RotatingFileHandler. When
+# the queue is full, or the log file cannot be opened, events are dropped and
+# counted instead of blocking or failing the caller.
+_LOG_Q: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=10000)
+_DROPPED: int = 0
+_DROPPED_LOCK = threading.Lock()
+_LISTENER: Optional[QueueListener] = None
+_LISTENER_LOCK = threading.Lock()
+
+_logger = logging.getLogger("app.workflow")
+_logger.setLevel(logging.INFO)
+_logger.propagate = False
 
 # One File produced per run
 # First call creates logs/run_YYYYMMDD_HHMMSS.log
 def _get_log_path() -> Path:
     global _LOG_PATH
     if _LOG_PATH is None:
-        log_dir = Path(__file__).resolve().parent / "logs" 
+        log_dir = Path(__file__).resolve().parent / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
         ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         _LOG_PATH = log_dir / f"run_{ts}.log"
     return _LOG_PATH
 
+# Rotated files keep the .log suffix (run_X.1.log) so the retention sweep still picks them up
+def _rotated_name(default_name: str) -> str:
+    base, _, index = default_name.rpartition(".")
+    return f"{base[:-len('.log')]}.{index}.log"
+
+# ts/expires_at are enqueued as datetimes and only formatted here, on the listener thread
+def _json_default(o: Any) -> str:
+    if isinstance(o, datetime):
+        return o.isoformat()
+    return str(o)
+
+def _count_drop() -> None:
+    global _DROPPED
+    with _DROPPED_LOCK:
+        _DROPPED += 1
+
+# RotatingFileHandler formats each record twice (shouldRollover, then emit), so the
+# JSON line is kept on the record and only serialized once
+class _JsonLineFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        line = getattr(record, "json_line", None)
+        if line is None:
+            line = record.json_line = json.dumps(record.msg, default=_json_default)
+        return line
+
+class _DroppingQueueHandler(QueueHandler):
+    # The listener runs in-process, so the record can be handed over as-is and
+    # serialized by the file handler instead of on the request thread
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _count_drop()
+
+class _FlushingQueueListener(QueueListener):
+    # the stop sentinel must not be dropped on a full queue: the thread is draining
+    # it, so wait for room and let stop() join the thread before handlers are closed
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+def _ensure_listener() -> None:
+    global _LISTENER
+    if _LISTENER is not None:
+        return
+    with _LISTENER_LOCK:
+        if _LISTENER is None:
+            fh = RotatingFileHandler(_get_log_path(), maxBytes=_MAX_BYTES, backupCount=_BACKUP_COUNT, encoding="utf-8")
+            fh.namer = _rotated_name
+            fh.setFormatter(_JsonLineFormatter())
+            if not _logger.handlers:
+                _logger.addHandler(_DroppingQueueHandler(_LOG_Q))
+            _LISTENER = _FlushingQueueListener(_LOG_Q, fh)
+            _LISTENER.start()
+
+@atexit.register
+def flush_pending() -> None:
+    """Stop the listener, which writes whatever is still queued, and close the log file."""
+    global _LISTENER
+    listener, _LISTENER = _LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for h in listener.handlers:
+        h.close()
+
+def dropped_count() -> int:
+    with _DROPPED_LOCK:
+        return _DROPPED
+
 def log_event(event: str, request_id: Optional[str]=None, actor: str="system", status: Optional[str] = None, step: Optional[str]=None, extra: Optional[dict[str, Any]]=None) -> None:
-    record = {"ts": datetime.now(timezone.utc).isoformat(), "expires_at": (datetime.now(timezone.utc) + timedelta(days=_RETENTION_DAYS)).isoformat(),"event": event, "request_id": request_id, "actor": actor, "status": status, "step": step, "extra": extra or {},
+    now = datetime.now(timezone.utc)
+    record = {"ts": now, "expires_at": now + _RETENTION,"event": event, "request_id": request_id, "actor": actor, "status": status, "step": step, "extra": extra or {},
               }
-    
-    try:
-        with _get_log_path().open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, default=str) + "\n")
-            #line = json.dumps(record, default=str)
-            #print(line, flush=True)
-    except Exception: pass
 
+    # best effort: a log directory/handler problem must never fail the caller's request
+    try:
+        _ensure_listener()
+        _logger.info(record)
+    except Exception:
+        _count_drop()
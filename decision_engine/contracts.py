@@ -1,8 +1,12 @@
 ﻿from __future__ import annotations
 
+import hashlib
+import re
+import threading
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, List, Optional, Literal
-from pydantic import BaseModel, Field
+from typing import Any, List, Optional, Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class Decision(str, Enum):
@@ -18,7 +22,15 @@ class Confidence(str, Enum):
     HIGH = "HIGH"
 
 
-class Citation(BaseModel):
+class ContractModel(BaseModel):
+    """
+    Base for all contract models. Frozen: the backend shares target profiles and
+    policy across packets, and nothing edits a packet or result after it is built.
+    """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class Citation(ContractModel):
     doc_id: str
     chunk_id: Optional[str] = None
     page: Optional[int] = None
@@ -26,7 +38,7 @@ class Citation(BaseModel):
     snippet: Optional[str] = None
 
 
-class EvidenceField(BaseModel):
+class EvidenceField(ContractModel):
     """
     General evidence container:
     - value: the extracted value (list/str/int/bool/etc.)
@@ -38,7 +50,7 @@ class EvidenceField(BaseModel):
     citations: List[Citation] = Field(default_factory=list)
 
 
-class CourseEvidence(BaseModel):
+class CourseEvidence(ContractModel):
     credits: EvidenceField
     contact_hours_lecture: EvidenceField
     contact_hours_lab: EvidenceField
@@ -50,14 +62,17 @@ class CourseEvidence(BaseModel):
     term_taken: EvidenceField = Field(default_factory=lambda: EvidenceField(unknown=True))     # e.g. "Fall 2022"
 
 
-class TargetCourseProfile(BaseModel):
+class TargetCourseProfile(ContractModel):
     target_credits: int
     target_lab_required: bool
     required_topics: List[str] = Field(default_factory=list)
     required_outcomes: List[str] = Field(default_factory=list)
 
+    # prepared matchers per required list, see _required_matchers()
+    _matchers: dict = PrivateAttr(default_factory=dict)
+
 
-class PolicyConfig(BaseModel):
+class PolicyConfig(ContractModel):
     # score bands (scores >= threshold fall into that band, highest-wins)
     approve_threshold: int = 90
     bridge_threshold: int = 80
@@ -74,8 +89,11 @@ class PolicyConfig(BaseModel):
     max_course_age_years: int = 0                # 0 = disabled
     must_include_topics: List[str] = Field(default_factory=list)
 
+    # prepared matchers for must_include_topics, see _required_matchers()
+    _matchers: dict = PrivateAttr(default_factory=dict)
+
 
-class DecisionInputsPacket(BaseModel):
+class DecisionInputsPacket(ContractModel):
     """
     Built by backend from stored evidence.
     Decision engine must be a pure function over this packet.
@@ -85,19 +103,22 @@ class DecisionInputsPacket(BaseModel):
     target_course: TargetCourseProfile
     policy: PolicyConfig
 
+    # memoized by the backend's compute_packet_hash; not part of the dump
+    _inputs_hash: Optional[str] = PrivateAttr(default=None)
 
-class ReasonItem(BaseModel):
+
+class ReasonItem(ContractModel):
     text: str
     citations: List[Citation] = Field(default_factory=list)
 
 
-class GapItem(BaseModel):
+class GapItem(ContractModel):
     text: str
     severity: Literal["HARD", "FIXABLE", "INFO_MISSING"]
     citations: List[Citation] = Field(default_factory=list)
 
 
-class BridgeItem(BaseModel):
+class BridgeItem(ContractModel):
     """Structured bridge-plan entry — what must be learned/completed to satisfy a gap."""
     text: str
     remediation_type: Optional[Literal["course", "lab", "exam", "self_study", "project"]] = None
@@ -105,7 +126,7 @@ class BridgeItem(BaseModel):
     addresses_gap: Optional[str] = None     # short label of the gap this closes
 
 
-class DecisionResult(BaseModel):
+class DecisionResult(ContractModel):
     decision: Decision
     equivalency_score: int           # 0-100, the scoring component
     confidence: Confidence
@@ -120,9 +141,15 @@ class DecisionResult(BaseModel):
 def _norm_list(val: Any) -> List[str]:
     if val is None:
         return []
-    if isinstance(val, list):
-        return [str(x).strip() for x in val if str(x).strip()]
-    return [str(val).strip()] if str(val).strip() else []
+    if not isinstance(val, list):
+        s = str(val).strip()
+        return [s] if s else []
+    out = []
+    for x in val:
+        s = str(x).strip()
+        if s:
+            out.append(s)
+    return out
 
 
 _STOPWORDS = frozenset({
@@ -138,36 +165,74 @@ def _stem_plural(w: str) -> str:
     return w
 
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
 def _tokenize(s: str) -> set:
     """Content-word token set: lowercase, punctuation-free, stopword-stripped, singularized."""
-    import re
     return {
         _stem_plural(t)
-        for t in re.findall(r"[a-z0-9]+", s.lower())
+        for t in _TOKEN_RE.findall(s.lower())
         if t not in _STOPWORDS
     }
 
 
-def _contains_required(required: str, candidates: List[str]) -> bool:
+# Separator for the joined candidate text; a required item without it can only
+# match inside a single candidate, never across two.
+_CANDIDATE_SEP = "\x00"
+
+
+def _prepare_candidates(candidates: List[str]) -> Tuple[str, List[Tuple[str, set]]]:
+    """
+    Lowercase and tokenize candidates once, so each required item can be checked against them.
+    Also returns all lowercased candidates joined into one string, so the forward
+    substring test is a single scan instead of one per candidate.
+    """
+    prepared = []
+    for c in candidates:
+        c_lower = c.lower()
+        prepared.append((c_lower, _tokenize(c_lower)))
+    return _CANDIDATE_SEP.join(c_lower for c_lower, _ in prepared), prepared
+
+
+def _prepare_required(item: str) -> Tuple[str, frozenset]:
+    """Lowercased text and token set of one required item."""
+    r = item.lower().strip()
+    return r, frozenset(_tokenize(r))
+
+
+def _required_matchers(model: ContractModel, items: List[str]) -> Tuple[Tuple[str, Tuple[str, frozenset]], ...]:
+    """
+    (item, prepared) pairs for one of a profile's or policy's required lists. Built
+    on first use and kept on the (frozen, shared) model, so decide() does not redo
+    it per packet; a model_copy() that swaps the list in gets its own pairs.
     """
-    Returns True when `required` matches any candidate via:
+    cached = model._matchers.get(id(items))
+    if cached is None or cached[0] is not items:
+        cached = (items, tuple((item, _prepare_required(item)) for item in items))
+        model._matchers[id(items)] = cached
+    return cached[1]
+
+
+def _contains_required(required: Tuple[str, frozenset], candidates: Tuple[str, List[Tuple[str, set]]]) -> bool:
+    """
+    Returns True when a prepared `required` item matches any prepared candidate via:
     - Exact or substring match (fast path), OR
     - 60%+ content-word overlap (handles 'analyze time complexity' vs
       'analyze time and space complexity', singular/plural, extra modifiers).
     """
-    r = required.lower().strip()
-    if not r:
+    r, r_tokens = required
+    if not r or not r_tokens:
         return False
 
-    r_tokens = _tokenize(r)
-    if not r_tokens:
-        return False
+    joined, prepared = candidates
+    scanned = _CANDIDATE_SEP not in r
+    if scanned and r in joined:
+        return True
 
-    for c in candidates:
-        c_lower = c.lower()
-        if r in c_lower or c_lower in r:
+    for c_lower, c_tokens in prepared:
+        if c_lower in r or (not scanned and r in c_lower):
             return True
-        c_tokens = _tokenize(c_lower)
         if c_tokens:
             overlap = len(r_tokens & c_tokens) / len(r_tokens)
             if overlap >= 0.6:
@@ -175,14 +240,21 @@ def _contains_required(required: str, candidates: List[str]) -> bool:
     return False
 
 
-def _overlap_score(required_items: List[str], found_items: List[str], weight: int):
-    """Returns (points, matched_required_items, missing_required_items)."""
-    if not required_items:
+def _overlap_score(required: Tuple[Tuple[str, Tuple[str, frozenset]], ...], found_items: List[str], weight: int):
+    """
+    Returns (points, matched_required_items, missing_required_items).
+    `required` is the _required_matchers() pairs of the required list.
+    """
+    if not required:
         return weight, [], []  # nothing required => full credit
-    matched = [r for r in required_items if _contains_required(r, found_items)]
-    missing = [r for r in required_items if r not in matched]
-    ratio = len(matched) / max(1, len(required_items))
-    points = int(round(weight * ratio))
+    candidates = _prepare_candidates(found_items)
+    matched, missing = [], []
+    for item, req in required:
+        (matched if _contains_required(req, candidates) else missing).append(item)
+    # integer form of round(weight * matched / required), including round-half-to-even
+    points, rem = divmod(weight * len(matched), len(required))
+    if 2 * rem > len(required) or (2 * rem == len(required) and points % 2):
+        points += 1
     return points, matched, missing
 
 
@@ -327,11 +399,51 @@ def aggregate_committee_votes(votes: List[Decision]) -> Decision:
     return winners[0]
 
 
+# Scoring weights for _decide() (sum to 100)
+W_TOPICS = 40
+W_OUTCOMES = 30
+W_CREDITS = 20
+W_LAB = 10
+
+
+# decide() results keyed on the packet contents (minus case_id) and the current
+# year, which the course-age rule reads. The lock covers lookup/insert/eviction since
+# sync handlers run on a threadpool.
+_DECIDE_CACHE: "OrderedDict[tuple, DecisionResult]" = OrderedDict()
+_DECIDE_CACHE_SIZE = 4096
+_DECIDE_LOCK = threading.Lock()
+
+
+def _packet_key(packet: DecisionInputsPacket) -> bytes:
+    raw = packet.model_dump_json(exclude={"case_id"}).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
 def decide(packet: DecisionInputsPacket) -> DecisionResult:
+    """
+    Memoized entry point for _decide(); identical packets are only scored once.
+    Each caller gets a deep copy, since the result's lists are mutable.
+    """
+    key = (_packet_key(packet), _current_year())
+    with _DECIDE_LOCK:
+        result = _DECIDE_CACHE.get(key)
+    if result is None:
+        result = _decide(packet)
+        with _DECIDE_LOCK:
+            if key not in _DECIDE_CACHE:
+                while len(_DECIDE_CACHE) >= _DECIDE_CACHE_SIZE:
+                    _DECIDE_CACHE.popitem(last=False)
+                _DECIDE_CACHE[key] = result
+    return result.model_copy(deep=True)
+
+
+def _decide(packet: DecisionInputsPacket) -> DecisionResult:
     """
     MVP decision engine:
     - deterministic, no IO
     - simple scoring + gap analysis
+    - output models use model_construct: every field comes from this function or
+      the already-validated packet, so re-validating them is wasted work
     """
     policy = packet.policy
     src = packet.source_course
@@ -342,12 +454,6 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
     bridge_items: List[BridgeItem] = []
     missing_info: List[str] = []
 
-    # Weights (sum to 100)
-    W_TOPICS = 40
-    W_OUTCOMES = 30
-    W_CREDITS = 20
-    W_LAB = 10
-
     score = 0
 
     # ---------------------------
@@ -356,7 +462,7 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
     credits_unknown = src.credits.unknown or src.credits.value is None
     if credits_unknown:
         if policy.require_credits_known:
-            gaps.append(GapItem(
+            gaps.append(GapItem.model_construct(
                 text="Source course credits are unknown.",
                 severity="INFO_MISSING",
                 citations=src.credits.citations,
@@ -370,7 +476,7 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
             src_credits = None
 
         if src_credits is None:
-            gaps.append(GapItem(
+            gaps.append(GapItem.model_construct(
                 text="Source course credits could not be parsed as a number.",
                 severity="INFO_MISSING",
                 citations=src.credits.citations,
@@ -379,25 +485,25 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
         else:
             if src_credits == tgt.target_credits:
                 score += W_CREDITS
-                reasons.append(ReasonItem(
+                reasons.append(ReasonItem.model_construct(
                     text=f"Credits match ({src_credits} credits).",
                     citations=src.credits.citations,
                 ))
             elif abs(src_credits - tgt.target_credits) == 1:
-                score += int(W_CREDITS * 0.5)
-                gaps.append(GapItem(
+                score += W_CREDITS // 2
+                gaps.append(GapItem.model_construct(
                     text=f"Credits are close but not equal (source {src_credits} vs target {tgt.target_credits}).",
                     severity="FIXABLE",
                     citations=src.credits.citations,
                 ))
-                bridge_items.append(BridgeItem(
+                bridge_items.append(BridgeItem.model_construct(
                     text="Complete an additional 1-credit bridge component if required by the department.",
                     remediation_type="course",
                     credits=1,
                     addresses_gap="credit_shortfall",
                 ))
             else:
-                gaps.append(GapItem(
+                gaps.append(GapItem.model_construct(
                     text=f"Credits do not match (source {src_credits} vs target {tgt.target_credits}).",
                     severity="HARD",
                     citations=src.credits.citations,
@@ -411,7 +517,7 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
 
     if lab_required:
         if lab_unknown:
-            gaps.append(GapItem(
+            gaps.append(GapItem.model_construct(
                 text="Target course requires a lab, but source lab information is unknown.",
                 severity="INFO_MISSING",
                 citations=src.lab_component.citations,
@@ -421,17 +527,17 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
             has_lab = bool(src.lab_component.value)
             if has_lab:
                 score += W_LAB
-                reasons.append(ReasonItem(
+                reasons.append(ReasonItem.model_construct(
                     text="Lab requirement satisfied (source includes a lab component).",
                     citations=src.lab_component.citations,
                 ))
             else:
-                gaps.append(GapItem(
+                gaps.append(GapItem.model_construct(
                     text="Target course requires a lab, but source course does not show a lab component.",
                     severity="FIXABLE",
                     citations=src.lab_component.citations,
                 ))
-                bridge_items.append(BridgeItem(
+                bridge_items.append(BridgeItem.model_construct(
                     text="Take the target lab (or an approved lab equivalent) as a bridge requirement.",
                     remediation_type="lab",
                     addresses_gap="lab_missing",
@@ -443,71 +549,74 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
     # ---------------------------
     # Topics / outcomes overlap
     # ---------------------------
-    topics = _norm_list(src.topics.value)
-    outcomes = _norm_list(src.outcomes.value)
-
     topics_unknown = src.topics.unknown or (src.topics.value is None)
     outcomes_unknown = src.outcomes.unknown or (src.outcomes.value is None)
 
+    # Only normalized when scored; the unknown-syllabus path below never reads them.
+    # must_include_topics reads `topics` only when topics are known, i.e. after the else branch.
+    topics: List[str] = []
     if policy.require_topics_or_outcomes and (topics_unknown and outcomes_unknown):
-        gaps.append(GapItem(
+        gaps.append(GapItem.model_construct(
             text="Both topics and learning outcomes are missing/unknown for the source course.",
             severity="INFO_MISSING",
             citations=(src.topics.citations + src.outcomes.citations),
         ))
         missing_info.append("Provide course topics and/or learning outcomes from the syllabus or official catalog.")
     else:
+        topics = _norm_list(src.topics.value)
+        outcomes = _norm_list(src.outcomes.value)
+
         # Topics score (against required topics)
-        pts_t, matched_topics, missing_topics = _overlap_score(tgt.required_topics, topics, W_TOPICS)
+        pts_t, matched_topics, missing_topics = _overlap_score(_required_matchers(tgt, tgt.required_topics), topics, W_TOPICS)
         score += pts_t
         if tgt.required_topics:
             if matched_topics:
-                reasons.append(ReasonItem(
+                reasons.append(ReasonItem.model_construct(
                     text=f"Matched {len(matched_topics)}/{len(tgt.required_topics)} required topics.",
                     citations=src.topics.citations,
                 ))
                 # Partial match: emit bridge items for each unmatched topic so APPROVE_WITH_BRIDGE has actionable advice
                 for t in missing_topics:
-                    bridge_items.append(BridgeItem(
+                    bridge_items.append(BridgeItem.model_construct(
                         text=f"Cover the missing topic '{t}' (self-study, module, or short course).",
                         remediation_type="self_study",
                         addresses_gap=f"topic_missing:{t}",
                     ))
             else:
-                gaps.append(GapItem(
+                gaps.append(GapItem.model_construct(
                     text="No required topics were clearly matched.",
                     severity="HARD",
                     citations=src.topics.citations,
                 ))
         else:
-            reasons.append(ReasonItem(
+            reasons.append(ReasonItem.model_construct(
                 text="No required topics specified for target course; topics not used as a strict constraint.",
                 citations=[],
             ))
 
         # Outcomes score (against required outcomes)
-        pts_o, matched_outcomes, missing_outcomes = _overlap_score(tgt.required_outcomes, outcomes, W_OUTCOMES)
+        pts_o, matched_outcomes, missing_outcomes = _overlap_score(_required_matchers(tgt, tgt.required_outcomes), outcomes, W_OUTCOMES)
         score += pts_o
         if tgt.required_outcomes:
             if matched_outcomes:
-                reasons.append(ReasonItem(
+                reasons.append(ReasonItem.model_construct(
                     text=f"Matched {len(matched_outcomes)}/{len(tgt.required_outcomes)} required learning outcomes.",
                     citations=src.outcomes.citations,
                 ))
                 for o in missing_outcomes:
-                    bridge_items.append(BridgeItem(
+                    bridge_items.append(BridgeItem.model_construct(
                         text=f"Demonstrate the missing learning outcome: '{o}' (project or exam).",
                         remediation_type="project",
                         addresses_gap=f"outcome_missing:{o}",
                     ))
             else:
-                gaps.append(GapItem(
+                gaps.append(GapItem.model_construct(
                     text="No required learning outcomes were clearly matched.",
                     severity="HARD",
                     citations=src.outcomes.citations,
                 ))
         else:
-            reasons.append(ReasonItem(
+            reasons.append(ReasonItem.model_construct(
                 text="No required learning outcomes specified for target course; outcomes not used as a strict constraint.",
                 citations=[],
             ))
@@ -522,7 +631,7 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
         min_rank = _grade_rank(policy.min_grade)
         grade_unknown = src.grade.unknown or src.grade.value in (None, "")
         if grade_unknown:
-            gaps.append(GapItem(
+            gaps.append(GapItem.model_construct(
                 text=f"Minimum grade policy is set ({policy.min_grade}) but source grade is unknown.",
                 severity="INFO_MISSING",
                 citations=src.grade.citations,
@@ -531,20 +640,20 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
         elif min_rank is not None:
             src_rank = _grade_rank(str(src.grade.value))
             if src_rank is None:
-                gaps.append(GapItem(
+                gaps.append(GapItem.model_construct(
                     text=f"Source grade ('{src.grade.value}') could not be parsed on the letter-grade scale.",
                     severity="INFO_MISSING",
                     citations=src.grade.citations,
                 ))
                 missing_info.append("Provide grade in a standard letter format (A, B+, C-, etc.).")
             elif src_rank > min_rank:
-                gaps.append(GapItem(
+                gaps.append(GapItem.model_construct(
                     text=f"Grade ({src.grade.value}) does not meet minimum policy ({policy.min_grade}).",
                     severity="HARD",
                     citations=src.grade.citations,
                 ))
             else:
-                reasons.append(ReasonItem(
+                reasons.append(ReasonItem.model_construct(
                     text=f"Grade ({src.grade.value}) meets the minimum policy ({policy.min_grade}).",
                     citations=src.grade.citations,
                 ))
@@ -553,11 +662,12 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
     if policy.min_contact_hours > 0:
         lec_known = not (src.contact_hours_lecture.unknown or src.contact_hours_lecture.value is None)
         lab_known = not (src.contact_hours_lab.unknown or src.contact_hours_lab.value is None)
+        hours_citations = src.contact_hours_lecture.citations + src.contact_hours_lab.citations
         if not (lec_known or lab_known):
-            gaps.append(GapItem(
+            gaps.append(GapItem.model_construct(
                 text=f"Minimum contact hours policy is set ({policy.min_contact_hours}h) but source contact hours are unknown.",
                 severity="INFO_MISSING",
-                citations=(src.contact_hours_lecture.citations + src.contact_hours_lab.citations),
+                citations=hours_citations,
             ))
             missing_info.append("Provide contact hours (lecture and/or lab) for the source course.")
         else:
@@ -566,21 +676,21 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
                 lab = int(src.contact_hours_lab.value or 0) if lab_known else 0
                 total_hours = lec + lab
                 if total_hours < policy.min_contact_hours:
-                    gaps.append(GapItem(
+                    gaps.append(GapItem.model_construct(
                         text=f"Contact hours ({total_hours}h) below minimum policy ({policy.min_contact_hours}h).",
                         severity="HARD",
-                        citations=(src.contact_hours_lecture.citations + src.contact_hours_lab.citations),
+                        citations=hours_citations,
                     ))
                 else:
-                    reasons.append(ReasonItem(
+                    reasons.append(ReasonItem.model_construct(
                         text=f"Contact hours ({total_hours}h) meet the minimum policy ({policy.min_contact_hours}h).",
-                        citations=(src.contact_hours_lecture.citations + src.contact_hours_lab.citations),
+                        citations=hours_citations,
                     ))
             except (TypeError, ValueError):
-                gaps.append(GapItem(
+                gaps.append(GapItem.model_construct(
                     text="Contact hours could not be parsed as numbers.",
                     severity="INFO_MISSING",
-                    citations=(src.contact_hours_lecture.citations + src.contact_hours_lab.citations),
+                    citations=hours_citations,
                 ))
                 missing_info.append("Provide contact hours in a clear numeric format.")
 
@@ -588,7 +698,7 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
     if policy.max_course_age_years > 0:
         term_unknown = src.term_taken.unknown or src.term_taken.value in (None, "")
         if term_unknown:
-            gaps.append(GapItem(
+            gaps.append(GapItem.model_construct(
                 text=f"Course expiration policy is set ({policy.max_course_age_years} years) but source term is unknown.",
                 severity="INFO_MISSING",
                 citations=src.term_taken.citations,
@@ -597,7 +707,7 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
         else:
             year = _parse_term_year(str(src.term_taken.value))
             if year is None:
-                gaps.append(GapItem(
+                gaps.append(GapItem.model_construct(
                     text=f"Term taken ('{src.term_taken.value}') could not be parsed to a year.",
                     severity="INFO_MISSING",
                     citations=src.term_taken.citations,
@@ -606,13 +716,13 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
             else:
                 age = _current_year() - year
                 if age > policy.max_course_age_years:
-                    gaps.append(GapItem(
+                    gaps.append(GapItem.model_construct(
                         text=f"Source course is {age} years old; policy maximum is {policy.max_course_age_years} years.",
                         severity="HARD",
                         citations=src.term_taken.citations,
                     ))
                 else:
-                    reasons.append(ReasonItem(
+                    reasons.append(ReasonItem.model_construct(
                         text=f"Source course is {age} years old, within the {policy.max_course_age_years}-year limit.",
                         citations=src.term_taken.citations,
                     ))
@@ -620,22 +730,27 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
     # must_include_topics: policy-level mandatory topics (beyond target-specific required_topics)
     if policy.must_include_topics:
         if topics_unknown:
-            gaps.append(GapItem(
+            gaps.append(GapItem.model_construct(
                 text="Mandatory topics policy is set but source topics are unknown.",
                 severity="INFO_MISSING",
                 citations=src.topics.citations,
             ))
             # missing_info already added by the earlier topics/outcomes check if applicable
         else:
-            missing_required = [t for t in policy.must_include_topics if not _contains_required(t, topics)]
+            topic_candidates = _prepare_candidates(topics)
+            missing_required = [
+                t
+                for t, req in _required_matchers(policy, policy.must_include_topics)
+                if not _contains_required(req, topic_candidates)
+            ]
             if missing_required:
-                gaps.append(GapItem(
+                gaps.append(GapItem.model_construct(
                     text=f"Missing mandatory policy topics: {', '.join(missing_required)}.",
                     severity="HARD",
                     citations=src.topics.citations,
                 ))
             else:
-                reasons.append(ReasonItem(
+                reasons.append(ReasonItem.model_construct(
                     text=f"All mandatory policy topics present ({len(policy.must_include_topics)}).",
                     citations=src.topics.citations,
                 ))
@@ -643,10 +758,12 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
     # ---------------------------
     # Decision ladder — 4 bands
     # ---------------------------
-    has_info_missing = any(g.severity == "INFO_MISSING" for g in gaps)
-    has_hard = any(g.severity == "HARD" for g in gaps)
-
-    has_fixable = any(g.severity == "FIXABLE" for g in gaps)
+    # one pass over the gaps for every severity the ladder and confidence need
+    severity_counts = {"HARD": 0, "FIXABLE": 0, "INFO_MISSING": 0}
+    for g in gaps:
+        severity_counts[g.severity] += 1
+    has_hard = severity_counts["HARD"] > 0
+    has_fixable = severity_counts["FIXABLE"] > 0
     has_bridge_items = len(bridge_items) > 0
 
     if has_hard:
@@ -674,17 +791,15 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
     # ---------------------------
     # Confidence + evidence quality
     # ---------------------------
-    unknown_count = sum([
-        1 if credits_unknown else 0,
-        1 if lab_unknown else 0,
-        1 if topics_unknown else 0,
-        1 if outcomes_unknown else 0,
-    ])
-    info_missing_count = sum(1 for g in gaps if g.severity == "INFO_MISSING")
+    # score only ever gains non-negative integer points from weights that sum to 100
+    assert 0 <= score <= 100, score
+    # all four flags are bools, so plain addition counts them without building a list
+    unknown_count = credits_unknown + lab_unknown + topics_unknown + outcomes_unknown
+    info_missing_count = severity_counts["INFO_MISSING"]
 
     confidence = _calibrated_confidence(
         decision=decision,
-        score=int(score),
+        score=score,
         policy=policy,
         unknown_count=unknown_count,
         has_hard=has_hard,
@@ -692,9 +807,9 @@ def decide(packet: DecisionInputsPacket) -> DecisionResult:
     )
     evidence_quality = _evidence_quality_score(src, policy)
 
-    return DecisionResult(
+    return DecisionResult.model_construct(
         decision=decision,
-        equivalency_score=max(0, min(100, int(score))),
+        equivalency_score=score,
         confidence=confidence,
         evidence_quality_score=evidence_quality,
         reasons=reasons,
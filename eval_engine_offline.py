@@ -27,6 +27,7 @@ import csv
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -42,12 +43,16 @@ REPO_ROOT = Path(__file__).resolve().parent
 CONFIG_DIR = REPO_ROOT / "config"
 
 
+# Config is read once per run: every case in a batch shares the same (frozen)
+# policy and per-code target profile instead of re-parsing the YAML files.
+@lru_cache(maxsize=None)
 def load_policy() -> PolicyConfig:
     with open(CONFIG_DIR / "policy.yaml", "r", encoding="utf-8") as f:
         data = yaml.safe_load(f) or {}
     return PolicyConfig(**data)
 
 
+@lru_cache(maxsize=None)
 def load_target(code: Optional[str]) -> TargetCourseProfile:
     """Load per-target course profile from config/target_courses.yaml (falls back to permissive default)."""
     if not code:
@@ -9,6 +9,11 @@ Runs your demo payloads (demo_cases/*.json) end-to-end against your FastAPI back
 3) POST /api/cases/{caseId}/extraction/complete   (using facts from each demo payload)
 4) GET  /api/cases/{caseId}/decision/result/latest
 
+Payloads run concurrently (--workers) over one shared keep-alive session.
+--fused collapses steps 1-4 into one POST /api/cases/pipeline call. That
+endpoint takes the payload facts directly and bypasses extraction/start and
+the PDF extraction pipeline, so it is opt-in; the default runs the four calls.
+
 Outputs:
 - demo_results.json (full responses per case)
 - demo_results.csv  (summary for quick midterm reporting)
@@ -23,14 +28,26 @@ from __future__ import annotations
 
 import argparse
 import csv
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 import os
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib json module
+    orjson = None
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:  # optional; without it the PDF is sent from bytes read once in main()
+    MultipartEncoder = None
 
 
 def die(msg: str) -> None:
@@ -39,36 +56,78 @@ def die(msg: str) -> None:
 
 
 def load_json(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
 def save_json(path: Path, obj: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        # orjson always writes UTF-8, the equivalent of ensure_ascii=False
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
     with path.open("w", encoding="utf-8") as f:
         json.dump(obj, f, indent=2, ensure_ascii=False)
 
 
+def dumps_json(obj: Any) -> str:
+    return orjson.dumps(obj).decode("utf-8") if orjson is not None else json.dumps(obj)
+
+
+def response_json(r: requests.Response) -> Any:
+    return orjson.loads(r.content) if orjson is not None else r.json()
+
+
 def save_csv(path: Path, rows: List[Dict[str, Any]], fieldnames: List[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8", newline="") as f:
         w = csv.DictWriter(f, fieldnames=fieldnames)
         w.writeheader()
-        for r in rows:
-            w.writerow(r)
+        w.writerows(rows)
+
+
+def make_session(pool_size: int) -> requests.Session:
+    """One keep-alive session shared by all workers, with a pool sized to match."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def post_multipart(
+    session: requests.Session,
+    url: str,
+    data: Dict[str, str],
+    pdf_path: Path,
+    pdf_bytes: Optional[bytes],
+    timeout_s: int,
+) -> requests.Response:
+    """POST form fields + the PDF, streaming the file from disk when requests-toolbelt is installed."""
+    if MultipartEncoder is None:
+        files = [
+            ("files", (pdf_path.name, pdf_bytes, "application/pdf")),
+        ]
+        return session.post(url, data=data, files=files, timeout=timeout_s)
+
+    with pdf_path.open("rb") as fh:
+        m = MultipartEncoder(fields=[*data.items(), ("files", (pdf_path.name, fh, "application/pdf"))])
+        return session.post(url, data=m, headers={"Content-Type": m.content_type}, timeout=timeout_s)
 
 
 def post_create_case(
+    session: requests.Session,
     base_url: str,
     pdf_path: Path,
+    pdf_bytes: Optional[bytes],
     student_id: str,
     student_name: str,
     course_requested: str,
     timeout_s: int,
 ) -> str:
     url = f"{base_url}/api/cases"
-    if not pdf_path.exists():
-        die(f"PDF not found: {pdf_path}")
 
     # Your API likely expects multipart form + file upload.
     data = {
@@ -76,28 +135,24 @@ def post_create_case(
         "studentName": student_name,
         "courseRequested": course_requested,
     }
-    files = [
-        ("files", (pdf_path.name, pdf_path.read_bytes(), "application/pdf")),
-    ]
-
-    r = requests.post(url, data=data, files=files, timeout=timeout_s)
+    r = post_multipart(session, url, data, pdf_path, pdf_bytes, timeout_s)
     if r.status_code != 200:
         die(f"POST /api/cases failed ({r.status_code}): {r.text}")
 
-    js = r.json()
+    js = response_json(r)
     case_id = js.get("caseId") or js.get("requestId") or js.get("id")
     if not case_id:
         die(f"Could not find caseId in /api/cases response: {js}")
     return case_id
 
 
-def post_extraction_start(base_url: str, case_id: str, timeout_s: int) -> str:
+def post_extraction_start(session: requests.Session, base_url: str, case_id: str, timeout_s: int) -> str:
     url = f"{base_url}/api/cases/{case_id}/extraction/start"
-    r = requests.post(url, timeout=timeout_s)
+    r = session.post(url, timeout=timeout_s)
     if r.status_code != 200:
         die(f"POST /extraction/start failed ({r.status_code}): {r.text}")
 
-    js = r.json()
+    js = response_json(r)
     run_id = js.get("extractionRunId")
     if not run_id:
         die(f"Could not find extractionRunId in /extraction/start response: {js}")
@@ -105,6 +160,7 @@ def post_extraction_start(base_url: str, case_id: str, timeout_s: int) -> str:
 
 
 def post_extraction_complete(
+    session: requests.Session,
     base_url: str,
     case_id: str,
     run_id: str,
@@ -116,19 +172,56 @@ def post_extraction_complete(
     payload = dict(facts_payload)
     payload["extractionRunId"] = run_id
 
-    r = requests.post(url, json=payload, timeout=timeout_s)
+    r = session.post(url, json=payload, timeout=timeout_s)
     if r.status_code != 200:
         # 422 is common for schema validation; include response text
         die(f"POST /extraction/complete failed ({r.status_code}): {r.text}")
-    return r.json()
+    return response_json(r)
 
 
-def get_latest_decision(base_url: str, case_id: str, timeout_s: int) -> Dict[str, Any]:
+def get_latest_decision(session: requests.Session, base_url: str, case_id: str, timeout_s: int) -> Dict[str, Any]:
     url = f"{base_url}/api/cases/{case_id}/decision/result/latest"
-    r = requests.get(url, timeout=timeout_s)
+    r = session.get(url, timeout=timeout_s)
     if r.status_code != 200:
         die(f"GET /decision/result/latest failed ({r.status_code}): {r.text}")
-    return r.json()
+    return response_json(r)
+
+
+def post_case_pipeline(
+    session: requests.Session,
+    base_url: str,
+    pdf_path: Path,
+    pdf_bytes: Optional[bytes],
+    student_id: str,
+    student_name: str,
+    course_requested: str,
+    facts_payload: Dict[str, Any],
+    timeout_s: int,
+) -> Dict[str, Any]:
+    """Steps 1-4 in a single request via POST /api/cases/pipeline."""
+    url = f"{base_url}/api/cases/pipeline"
+    data = {
+        "studentId": student_id,
+        "studentName": student_name,
+        "courseRequested": course_requested,
+        "facts": dumps_json(facts_payload["facts"]),
+    }
+    r = post_multipart(session, url, data, pdf_path, pdf_bytes, timeout_s)
+    if r.status_code != 200:
+        die(f"POST /api/cases/pipeline failed ({r.status_code}): {r.text}")
+
+    js = response_json(r)
+    if not js.get("caseId"):
+        die(f"Could not find caseId in /api/cases/pipeline response: {js}")
+    return js
+
+
+def _first_present(d: Dict[str, Any], *keys: str) -> Any:
+    """Value of the first key present in d (None if none are), so falsy values like 0 are kept."""
+    for k in keys:
+        if k in d:
+            return d[k]
+    return None
 
 
 def summarize_case(
@@ -138,34 +231,118 @@ def summarize_case(
     complete_resp: Dict[str, Any],
     latest_resp: Dict[str, Any],
 ) -> Dict[str, Any]:
-    # Try to be resilient to your response shape
-    decision = None
-    score = None
-    confidence = None
-    needs_more_info = None
-
-    # Your /decision/result/latest response example includes decisionInputs and likely resultJson
-    result_json = latest_resp.get("resultJson") or latest_resp.get("result_json") or {}
-    needs_more_info = latest_resp.get("needsMoreInfo", latest_resp.get("needs_more_info"))
-
-    if isinstance(result_json, dict):
-        decision = result_json.get("decision")
-        score = result_json.get("equivalency_score") or result_json.get("equivalencyScore")
-        confidence = result_json.get("confidence")
+    # One merged view of both responses; the complete-extraction response wins on shared keys.
+    # camelCase is what the API sends, snake_case alternates keep older responses readable.
+    view = {**latest_resp, **complete_resp}
+    result_json = _first_present(view, "resultJson", "result_json")
+    if not isinstance(result_json, dict):
+        result_json = {}
 
     return {
         "payload": payload_name,
         "case_id": case_id,
         "extraction_run_id": extraction_run_id,
-        "decision_run_id": complete_resp.get("decisionRunId") or latest_resp.get("decisionRunId"),
-        "case_status": complete_resp.get("caseStatus") or latest_resp.get("status"),
-        "decision": decision,
-        "equivalency_score": score,
-        "confidence": confidence,
-        "needs_more_info": needs_more_info,
+        "decision_run_id": view.get("decisionRunId"),
+        "case_status": _first_present(view, "caseStatus", "status"),
+        "decision": result_json.get("decision"),
+        "equivalency_score": _first_present(result_json, "equivalency_score", "equivalencyScore"),
+        "confidence": result_json.get("confidence"),
+        "needs_more_info": _first_present(view, "needsMoreInfo", "needs_more_info"),
     }
 
 
+def run_steps(
+    session: requests.Session,
+    base_url: str,
+    pdf_path: Path,
+    pdf_bytes: Optional[bytes],
+    args: argparse.Namespace,
+    payload_name: str,
+    facts_payload: Dict[str, Any],
+) -> Tuple[str, str, Dict[str, Any], Dict[str, Any]]:
+    """The original four-call sequence; returns (case_id, run_id, complete_resp, latest)."""
+    # 1) create case
+    case_id = post_create_case(
+        session=session,
+        base_url=base_url,
+        pdf_path=pdf_path,
+        pdf_bytes=pdf_bytes,
+        student_id=args.student_id,
+        student_name=args.student_name,
+        course_requested=args.course_requested,
+        timeout_s=args.timeout,
+    )
+    print(f"[{payload_name}] caseId = {case_id}")
+
+    # 2) start extraction
+    run_id = post_extraction_start(session=session, base_url=base_url, case_id=case_id, timeout_s=args.timeout)
+    print(f"[{payload_name}] extractionRunId = {run_id}")
+
+    # 3) complete extraction (auto-triggers decision)
+    complete_resp = post_extraction_complete(
+        session=session,
+        base_url=base_url,
+        case_id=case_id,
+        run_id=run_id,
+        facts_payload=facts_payload,
+        timeout_s=args.timeout,
+    )
+    print(f"[{payload_name}] complete: decisionRunId = {complete_resp.get('decisionRunId')} caseStatus = {complete_resp.get('caseStatus')}")
+
+    # 4) fetch latest decision
+    latest = get_latest_decision(session=session, base_url=base_url, case_id=case_id, timeout_s=args.timeout)
+    return case_id, run_id, complete_resp, latest
+
+
+def run_one(
+    payload_name: str,
+    facts_payload: Dict[str, Any],
+    session: requests.Session,
+    pdf_path: Path,
+    pdf_bytes: Optional[bytes],
+    args: argparse.Namespace,
+    base_url: str,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run one payload through the pipeline (fused or four-step); returns (detailed, summary)."""
+    print(f"[{payload_name}] running")
+
+    if args.fused:
+        # 1-4 in one round trip; the response carries both the complete and latest fields
+        complete_resp = latest = post_case_pipeline(
+            session=session,
+            base_url=base_url,
+            pdf_path=pdf_path,
+            pdf_bytes=pdf_bytes,
+            student_id=args.student_id,
+            student_name=args.student_name,
+            course_requested=args.course_requested,
+            facts_payload=facts_payload,
+            timeout_s=args.timeout,
+        )
+        case_id = complete_resp["caseId"]
+        run_id = complete_resp.get("extractionRunId")
+        print(f"[{payload_name}] caseId = {case_id} decisionRunId = {complete_resp.get('decisionRunId')} caseStatus = {complete_resp.get('caseStatus')}")
+    else:
+        case_id, run_id, complete_resp, latest = run_steps(session, base_url, pdf_path, pdf_bytes, args, payload_name, facts_payload)
+
+    result_json = latest.get("resultJson") or {}
+    decision = result_json.get("decision") if isinstance(result_json, dict) else None
+    print(f"[{payload_name}] latest decision = {decision}")
+
+    if args.sleep > 0:
+        time.sleep(args.sleep)
+
+    # detailed + summary
+    detailed = {
+        "payload": payload_name,
+        "caseId": case_id,
+        "extractionRunId": run_id,
+        "extractionCompleteResponse": complete_resp,
+        "latestDecisionResponse": latest,
+    }
+    return detailed, summarize_case(payload_name, case_id, run_id, complete_resp, latest)
+
+
 def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--base-url", default="http://127.0.0.1:8000", help="FastAPI base URL")
@@ -175,7 +352,10 @@ def main() -> None:
     ap.add_argument("--student-name", default="Demo Student", help="Student name used for case creation")
     ap.add_argument("--course-requested", default="CPSC-DEMO", help="Course requested field")
     ap.add_argument("--timeout", type=int, default=30, help="HTTP timeout seconds")
-    ap.add_argument("--sleep", type=float, default=0.0, help="Seconds to sleep between cases")
+    ap.add_argument("--sleep", type=float, default=0.0, help="Seconds each worker sleeps after a case")
+    ap.add_argument("--workers", type=int, default=8, help="Cases run concurrently")
+    ap.add_argument("--fused", action=argparse.BooleanOptionalAction, default=False,
+                    help="Use the single POST /api/cases/pipeline call (skips extraction/start and PDF extraction)")
     ap.add_argument("--out-json", default="demo_results/demo_results.json")
     ap.add_argument("--out-csv", default="demo_results/demo_results.csv")
     args = ap.parse_args()
@@ -187,66 +367,38 @@ def main() -> None:
     if not cases_dir.exists():
         die(f"cases dir not found: {cases_dir}")
 
-    payload_files = sorted([p for p in cases_dir.glob("*.json") if p.is_file()])
+    payload_files = sorted(p for p in cases_dir.glob("*.json") if p.is_file())
     if not payload_files:
         die(f"No payloads found in {cases_dir} (expected *.json)")
 
-    all_results: List[Dict[str, Any]] = []
-    summary_rows: List[Dict[str, Any]] = []
-
+    # Parse and validate every payload up front so a bad file fails before any HTTP call
+    payloads: List[Tuple[str, Dict[str, Any]]] = []
     for p in payload_files:
-        payload_name = p.name
-        print(f"\n=== Running {payload_name} ===")
-
         facts_payload = load_json(p)
         if "facts" not in facts_payload or not isinstance(facts_payload["facts"], list):
-            die(f"{payload_name} must contain a top-level 'facts' list")
-
-        # 1) create case
-        case_id = post_create_case(
-            base_url=base_url,
-            pdf_path=pdf_path,
-            student_id=args.student_id,
-            student_name=args.student_name,
-            course_requested=args.course_requested,
-            timeout_s=args.timeout,
-        )
-        print(f"caseId = {case_id}")
-
-        # 2) start extraction
-        run_id = post_extraction_start(base_url=base_url, case_id=case_id, timeout_s=args.timeout)
-        print(f"extractionRunId = {run_id}")
-
-        # 3) complete extraction (auto-triggers decision)
-        complete_resp = post_extraction_complete(
-            base_url=base_url,
-            case_id=case_id,
-            run_id=run_id,
-            facts_payload=facts_payload,
-            timeout_s=args.timeout,
-        )
-        print(f"complete: decisionRunId = {complete_resp.get('decisionRunId')} caseStatus = {complete_resp.get('caseStatus')}")
-
-        # 4) fetch latest decision
-        latest = get_latest_decision(base_url=base_url, case_id=case_id, timeout_s=args.timeout)
-        result_json = latest.get("resultJson") or {}
-        decision = result_json.get("decision") if isinstance(result_json, dict) else None
-        print(f"latest decision = {decision}")
-
-        # store detailed + summary
-        all_results.append(
-            {
-                "payload": payload_name,
-                "caseId": case_id,
-                "extractionRunId": run_id,
-                "extractionCompleteResponse": complete_resp,
-                "latestDecisionResponse": latest,
-            }
-        )
-        summary_rows.append(summarize_case(payload_name, case_id, run_id, complete_resp, latest))
+            die(f"{p.name} must contain a top-level 'facts' list")
+        payloads.append((p.name, facts_payload))
 
-        if args.sleep > 0:
-            time.sleep(args.sleep)
+    if not pdf_path.exists():
+        die(f"PDF not found: {pdf_path}")
+    # read once and shared by every case, unless the upload can stream from disk
+    pdf_bytes = pdf_path.read_bytes() if MultipartEncoder is None else None
+
+    workers = max(1, min(args.workers, len(payloads)))
+    session = make_session(workers)
+
+    # Payloads are independent, so run them concurrently and restore file order afterwards
+    results: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(run_one, name, facts_payload, session, pdf_path, pdf_bytes, args, base_url): name
+            for name, facts_payload in payloads
+        }
+        for fut in as_completed(futures):
+            results[futures[fut]] = fut.result()
+
+    all_results: List[Dict[str, Any]] = [results[name][0] for name, _ in payloads]
+    summary_rows: List[Dict[str, Any]] = [results[name][1] for name, _ in payloads]
 
     out_json = Path(args.out_json)
     out_csv = Path(args.out_csv)
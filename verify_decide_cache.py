@@ -0,0 +1,139 @@
+"""
+Targeted verification of the decide() result cache in decision_engine/contracts.py.
+
+decide() memoizes _decide() on the packet contents (minus case_id) and the
+current year. This script checks that identical packets are scored once, that
+a changed packet or a year rollover is scored again, and that callers get
+their own copy of a cached result. No OpenAI calls, no database.
+
+Usage:
+    python verify_decide_cache.py
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+import decision_engine.contracts as contracts
+from decision_engine.contracts import (
+    DecisionInputsPacket, EvidenceField, PolicyConfig, ReasonItem, decide,
+)
+from verify_configurable_rules import TARGET_PROGRAMMING_I, _make_evidence
+
+
+@contextmanager
+def _counting_decide():
+    """Start from an empty cache and count the real _decide() calls made inside the block."""
+    calls = []
+    original = contracts._decide
+
+    def counted(packet):
+        calls.append(packet.case_id)
+        return original(packet)
+
+    contracts._DECIDE_CACHE.clear()
+    contracts._decide = counted
+    try:
+        yield calls
+    finally:
+        contracts._decide = original
+        contracts._DECIDE_CACHE.clear()
+
+
+@contextmanager
+def _frozen_year(year: int):
+    original = contracts._current_year
+    contracts._current_year = lambda: year
+    try:
+        yield
+    finally:
+        contracts._current_year = original
+
+
+def _packet(case_id: str, policy: PolicyConfig = None, **evidence) -> DecisionInputsPacket:
+    return DecisionInputsPacket(
+        case_id=case_id,
+        source_course=_make_evidence(**evidence),
+        target_course=TARGET_PROGRAMMING_I,
+        policy=policy or PolicyConfig(),
+    )
+
+
+def _report(name: str, ok: bool, detail: str) -> bool:
+    print(f"  [{'PASS' if ok else 'FAIL'}] {name}")
+    print(f"         {detail}")
+    return ok
+
+
+def test_identical_packets_hit() -> bool:
+    """Two packets differing only in case_id are scored once and give equal results."""
+    with _counting_decide() as calls:
+        first = decide(_packet("case-a"))
+        second = decide(_packet("case-b"))
+    ok = len(calls) == 1 and first == second
+    return _report("identical packets (different case_id) hit the cache", ok, f"_decide calls={len(calls)}, equal={first == second}")
+
+
+def test_changed_packet_misses() -> bool:
+    """A packet with different evidence is scored again."""
+    with _counting_decide() as calls:
+        decide(_packet("case-a"))
+        decide(_packet("case-a", grade=EvidenceField(value="B", unknown=False)))
+    ok = len(calls) == 2
+    return _report("changed evidence misses the cache", ok, f"_decide calls={len(calls)}")
+
+
+def test_year_rollover_misses() -> bool:
+    """The same packet is rescored in a new year, so the course-age rule sees the new age."""
+    policy = PolicyConfig(max_course_age_years=5)
+    packet = _packet("case-age", policy, term_taken=EvidenceField(value="Fall 2020", unknown=False))
+    with _counting_decide() as calls:
+        with _frozen_year(2025):
+            before = decide(packet)
+            decide(packet)
+        with _frozen_year(2026):
+            after = decide(packet)
+    hard_before = any(g.severity == "HARD" and "years old" in g.text for g in before.gaps)
+    hard_after = any(g.severity == "HARD" and "years old" in g.text for g in after.gaps)
+    ok = len(calls) == 2 and not hard_before and hard_after
+    return _report(
+        "year rollover misses the cache",
+        ok,
+        f"_decide calls={len(calls)}, age gap in 2025={hard_before}, in 2026={hard_after}",
+    )
+
+
+def test_results_are_copies() -> bool:
+    """Mutating a returned result must not leak into later cache hits."""
+    with _counting_decide() as calls:
+        first = decide(_packet("case-a"))
+        n_reasons = len(first.reasons)
+        first.reasons.append(ReasonItem(text="injected"))
+        second = decide(_packet("case-a"))
+    ok = len(calls) == 1 and len(second.reasons) == n_reasons
+    return _report("cached results are handed out as copies", ok, f"reasons after mutation={len(second.reasons)}/{n_reasons}")
+
+
+def main() -> int:
+    print("decide() result cache — deterministic verification")
+    print("=" * 68)
+
+    tests = [
+        ("cache hit",        test_identical_packets_hit),
+        ("cache miss",       test_changed_packet_misses),
+        ("year rollover",    test_year_rollover_misses),
+        ("copy on return",   test_results_are_copies),
+    ]
+
+    passed = 0
+    for label, fn in tests:
+        print(f"\n--- {label} ---")
+        if fn():
+            passed += 1
+
+    print("\n" + "=" * 68)
+    print(f"Passed: {passed}/{len(tests)}")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
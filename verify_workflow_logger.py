@@ -0,0 +1,134 @@
+"""
+Targeted verification of app/workflow_logger.py.
+
+log_event only enqueues; a QueueListener thread writes JSON lines to a
+RotatingFileHandler. This script checks that events which cannot be queued or
+written are counted (also under concurrent callers), that rotated files keep
+the .log suffix, and that flush_pending writes every queued event. Log files
+go to a temporary directory, not app/logs.
+
+Usage:
+    python verify_workflow_logger.py
+"""
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import tempfile
+import threading
+from pathlib import Path
+
+import app.workflow_logger as wl
+
+
+def _report(name: str, ok: bool, detail: str) -> bool:
+    print(f"  [{'PASS' if ok else 'FAIL'}] {name}")
+    print(f"         {detail}")
+    return ok
+
+
+def _record(i: int) -> logging.LogRecord:
+    return logging.LogRecord("app.workflow", logging.INFO, __file__, 0, {"event": "Verify", "i": i}, None, None)
+
+
+def test_rotated_name() -> bool:
+    """run_X.log.1 (RotatingFileHandler's default) must become run_X.1.log."""
+    got = wl._rotated_name("/tmp/logs/run_20260101T000000Z.log.3")
+    ok = got == "/tmp/logs/run_20260101T000000Z.3.log"
+    return _report("rotated files keep the .log suffix", ok, f"run_...log.3 -> {got}")
+
+
+def test_full_queue_drops_are_counted() -> bool:
+    """Every record that does not fit the queue is counted, even with many threads enqueueing."""
+    capacity, threads, per_thread = 10, 8, 500
+    handler = wl._DroppingQueueHandler(queue.Queue(maxsize=capacity))
+    before = wl.dropped_count()
+
+    def flood():
+        for i in range(per_thread):
+            handler.handle(_record(i))
+
+    workers = [threading.Thread(target=flood) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+    dropped = wl.dropped_count() - before
+    expected = threads * per_thread - capacity
+    return _report("full-queue drops are counted under concurrency", dropped == expected, f"dropped={dropped}, expected={expected}")
+
+
+def test_unwritable_log_is_counted(tmp: Path) -> bool:
+    """If the log file cannot be opened, log_event must not raise and the event is counted."""
+    blocker = tmp / "not_a_dir"
+    blocker.write_text("")
+    wl._LOG_PATH = blocker / "run_x.log"
+    before = wl.dropped_count()
+    try:
+        wl.log_event("VerifyUnwritable")
+        raised = None
+    except Exception as e:
+        raised = e
+    finally:
+        wl._LOG_PATH = None
+    dropped = wl.dropped_count() - before
+    ok = raised is None and dropped == 1 and wl._LISTENER is None
+    return _report("unwritable log file is dropped, not raised", ok, f"raised={raised!r}, dropped={dropped}")
+
+
+def test_rotation_and_flush(tmp: Path) -> bool:
+    """Small max size forces rollovers; after flush_pending all 200 events are on disk as JSON lines."""
+    log_dir = tmp / "logs"
+    log_dir.mkdir()
+    wl._LOG_PATH = log_dir / "run_verify.log"
+    original_max, original_backups = wl._MAX_BYTES, wl._BACKUP_COUNT
+    wl._MAX_BYTES, wl._BACKUP_COUNT = 4096, 100
+    try:
+        for i in range(200):
+            wl.log_event("VerifyRotation", request_id=str(i))
+        wl.flush_pending()
+    finally:
+        wl._MAX_BYTES, wl._BACKUP_COUNT = original_max, original_backups
+        wl._LOG_PATH = None
+
+    names = sorted(p.name for p in log_dir.iterdir())
+    lines = [line for p in log_dir.iterdir() for line in p.read_text(encoding="utf-8").splitlines()]
+    parsed = [json.loads(line) for line in lines]
+    ok = (
+        len(parsed) == 200
+        and "run_verify.1.log" in names
+        and all(n.endswith(".log") for n in names)
+        and all(r["event"] == "VerifyRotation" and r["ts"] < r["expires_at"] for r in parsed)
+        and wl._LISTENER is None
+    )
+    return _report("rollover naming and flush_pending", ok, f"files={len(names)}, lines written={len(parsed)}/200")
+
+
+def main() -> int:
+    print("Workflow logger — verification")
+    print("=" * 68)
+
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        tests = [
+            ("rotation naming",       test_rotated_name),
+            ("drop counting",         test_full_queue_drops_are_counted),
+            ("unwritable log file",   lambda: test_unwritable_log_is_counted(tmp)),
+            ("rotation + flush",      lambda: test_rotation_and_flush(tmp)),
+        ]
+
+        passed = 0
+        for label, fn in tests:
+            print(f"\n--- {label} ---")
+            if fn():
+                passed += 1
+
+    print("\n" + "=" * 68)
+    print(f"Passed: {passed}/{len(tests)}")
+    return 0 if passed == len(tests) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())